@@ -3,9 +3,16 @@ Resume Analyzer - Main Dash Application
 Uses Dash Pages for multi-page structure
 """
 
+import os
+
 import dash
 import dash_bootstrap_components as dbc
-from dash import html
+import diskcache
+from dash import DiskcacheManager, html
+
+# Background callbacks (streamed analysis results) run in separate processes
+# and report their progress through this cache
+background_callback_manager = DiskcacheManager(diskcache.Cache("./tmp/callback_cache"))
 
 # Initialize Dash app with Pages plugin
 app = dash.Dash(
@@ -13,6 +20,8 @@ app = dash.Dash(
     use_pages=True,  # Enable Dash Pages
     external_stylesheets=[dbc.themes.BOOTSTRAP, dbc.icons.FONT_AWESOME],
     suppress_callback_exceptions=True,
+    background_callback_manager=background_callback_manager,
+    compress=True,  # gzip/brotli responses, including layout and callback JSON
     title="Resume Analyzer"
 )
 
@@ -43,4 +52,5 @@ app.layout = html.Div([
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8050)
+    # Development server only; use `gunicorn -c gunicorn_conf.py app:server` in production
+    app.run(debug=os.getenv('DASH_DEBUG') == '1', host='0.0.0.0', port=8050)
@@ -0,0 +1,37 @@
+// dcc.Upload silently drops files over its max_size: no callback runs, so the
+// upload would look like it did nothing. Catch those files as they are dropped
+// or picked (capture phase, before the Upload component sees the event) and
+// report them in the upload's status area instead.
+(function () {
+    function reportOversizedFile(event) {
+        const section = event.target.closest && event.target.closest('[data-upload-prefix]');
+        if (!section) {
+            return;
+        }
+        const files = event.type === 'drop' ? event.dataTransfer.files : event.target.files;
+        const file = files && files[0];
+        const maxBytes = Number(section.dataset.maxBytes);
+        if (!file || file.size <= maxBytes) {
+            return;
+        }
+
+        const prefix = section.dataset.uploadPrefix;
+        const maxMegabytes = Math.round(maxBytes / (1024 * 1024));
+        window.dash_clientside.set_props(`${prefix}-upload-status`, {
+            children: {
+                type: 'Alert',
+                namespace: 'dash_bootstrap_components',
+                props: {
+                    children: `✗ ${file.name} is larger than the ${maxMegabytes} MB upload limit`,
+                    color: 'danger',
+                    className: 'mt-2'
+                }
+            }
+        });
+        // Like a file that fails to parse, drop any previously loaded content
+        window.dash_clientside.set_props(`${prefix}-content-store`, {data: null});
+    }
+
+    document.addEventListener('drop', reportOversizedFile, true);
+    document.addEventListener('change', reportOversizedFile, true);
+})();
@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for production deployments
+Usage: gunicorn -c gunicorn_conf.py app:server
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8050')}"
+
+# Analyses spend most of their time waiting on the OpenAI API, so each worker
+# runs several threads that can wait on different requests at the same time
+workers = int(os.getenv('WORKERS', max(2, os.cpu_count() or 1)))
+worker_class = "gthread"
+threads = int(os.getenv('THREADS', '8'))
+
+# LLM calls are slow; give requests time to finish before a worker is restarted
+timeout = 120
@@ -67,7 +67,8 @@ def layout():
                         html.H5("Privacy & Security:", className="mt-4 mb-3"),
                         html.P([
                             "Your documents are processed securely and are not stored permanently. ",
-                            "Files are temporarily saved during analysis and deleted immediately after. ",
+                            "Uploaded files are processed in memory and are never written to disk. ",
+                            "Analysis results are cached on the server so repeat analyses of the same documents are instant. ",
                             "We use OpenAI's API which follows strict data privacy guidelines."
                         ]),
                         
@@ -2,30 +2,48 @@
 Home Page - Resume Analysis Interface
 """
 
-import os
-import json
+import io
+import re
 import base64
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from html import escape as escape_html
 from pathlib import Path
+from types import MappingProxyType
 
 import dash
-from dash import html, dcc, callback, Input, Output, State, no_update
+from dash import html, dcc, callback, clientside_callback, ctx, Input, Output, State, no_update
 import dash_bootstrap_components as dbc
+from dash.development.base_component import Component
 from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 
-# Import the resume analyzer
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-from resume_analyzer.resume_analyzer import ResumeAnalyzer
-
 # Register page
 dash.register_page(__name__, path='/', name='Home')
 
-# Initialize the analyzer
-try:
-    analyzer = ResumeAnalyzer()
-except ValueError:
-    analyzer = None
+# Largest accepted upload, enforced by the browser and again on the server
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Analysis results cache, shared by all workers and kept across restarts
+ANALYSIS_CACHE_DIR = "./tmp/analysis_cache"
+
+
+@functools.cache
+def get_analyzer():
+    """
+    Return the shared analyzer, created on first use.
+
+    Dash imports every page at startup, so the OpenAI SDK is only loaded once
+    this page is actually used. Returns None if no API key is configured.
+    """
+    from resume_analyzer import ResumeAnalyzer
+
+    try:
+        return ResumeAnalyzer(cache_dir=ANALYSIS_CACHE_DIR)
+    except ValueError:
+        return None
 
 
 def create_upload_section(id_prefix, label):
@@ -38,6 +56,8 @@ def create_upload_section(id_prefix, label):
                     label="Upload File",
                     tab_id=f"{id_prefix}-upload-tab",
                     children=[
+                        # The data attributes let assets/upload_limit.js report
+                        # files the browser rejects for being over max_size
                         html.Div([
                             dcc.Upload(
                                 id=f'{id_prefix}-upload',
@@ -47,7 +67,7 @@ def create_upload_section(id_prefix, label):
                                     'Drag and Drop or ',
                                     html.A('Select File', style={'color': '#007bff', 'cursor': 'pointer'}),
                                     html.Br(),
-                                    html.Small('Supported: .txt, .pdf, .docx', className="text-muted")
+                                    html.Small('Supported: .txt, .pdf, .docx (max 10 MB)', className="text-muted")
                                 ]),
                                 style={
                                     'width': '100%',
@@ -59,10 +79,11 @@ def create_upload_section(id_prefix, label):
                                     'textAlign': 'center',
                                     'margin': '20px 0'
                                 },
-                                multiple=False
+                                multiple=False,
+                                max_size=MAX_UPLOAD_BYTES
                             ),
                             html.Div(id=f'{id_prefix}-upload-status', className="mt-2")
-                        ])
+                        ], **{'data-upload-prefix': id_prefix, 'data-max-bytes': MAX_UPLOAD_BYTES})
                     ]
                 ),
                 dbc.Tab(
@@ -74,7 +95,8 @@ def create_upload_section(id_prefix, label):
                                 id=f'{id_prefix}-text',
                                 placeholder=f"Paste your {label.lower()} here...",
                                 style={'height': '200px', 'marginTop': '20px'},
-                                className="form-control"
+                                className="form-control",
+                                debounce=True  # Send text on blur, not on every keystroke
                             )
                         ])
                     ]
@@ -84,96 +106,189 @@ def create_upload_section(id_prefix, label):
     ], className="mb-4")
 
 
+# Markdown characters that must be escaped to show up literally in badge text
+_MARKDOWN_SPECIAL = re.compile(r'([\\`*_\[\]~])')
+
+# Alert color for each overall match level
+_MATCH_COLORS = MappingProxyType({
+    'Excellent': 'success',
+    'Good': 'info',
+    'Fair': 'warning',
+    'Poor': 'danger'
+})
+
+
 def get_match_color(match_level):
     """Get alert color based on match level."""
-    colors = {
-        'Excellent': 'success',
-        'Good': 'info',
-        'Fair': 'warning',
-        'Poor': 'danger'
+    return _MATCH_COLORS.get(match_level, 'secondary')
+
+
+# Static parts of the results layout, built once at import and shared by every render
+_RESULTS_TITLE = dbc.Row([
+    dbc.Col([
+        html.H3("📊 Analysis Results", className="mb-4")
+    ])
+])
+
+_CARD_HEADERS = {
+    'analysis_summary': dbc.CardHeader(html.H5("📝 Summary", className="mb-0")),
+    'key_strengths': dbc.CardHeader(html.H5("✨ Key Strengths", className="mb-0")),
+    'matching_skills': dbc.CardHeader(html.H5("✅ Matching Skills", className="mb-0")),
+    'missing_skills': dbc.CardHeader(html.H5("❌ Missing Skills", className="mb-0")),
+    'partial_matches': dbc.CardHeader(html.H5("⚠️ Partial Matches", className="mb-0")),
+    'recommendations': dbc.CardHeader(html.H5("💡 Recommendations", className="mb-0")),
+}
+
+_DOWNLOAD_ROW = dbc.Row([
+    dbc.Col([
+        dbc.Button(
+            [html.I(className="fas fa-download me-2"), "Download Results (JSON)"],
+            id="download-button",
+            color="success",
+            size="lg",
+            className="w-100"
+        )
+    ], md=6, className="mx-auto")
+])
+
+_PENDING_ROW = dbc.Row([
+    dbc.Col([
+        dbc.Spinner(color="primary"),
+        html.Span("Analyzing...", className="ms-2 text-muted")
+    ], className="text-center")
+], className="mb-4")
+
+# Figure templates, validated by Plotly once at import. Renders copy only the
+# trace they change and pass plain dicts to dcc.Graph, skipping validation.
+_GAUGE_TEMPLATE = go.Figure(go.Indicator(
+    mode="gauge+number+delta",
+    value=0,
+    domain={'x': [0, 1], 'y': [0, 1]},
+    title={'text': "Match Score", 'font': {'size': 24}},
+    delta={'reference': 70, 'increasing': {'color': "green"}},
+    gauge={
+        'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
+        'bar': {'color': "darkblue"},
+        'bgcolor': "white",
+        'borderwidth': 2,
+        'bordercolor': "gray",
+        'steps': [
+            {'range': [0, 50], 'color': '#ffebee'},
+            {'range': [50, 70], 'color': '#fff9c4'},
+            {'range': [70, 100], 'color': '#e8f5e9'}
+        ],
+        'threshold': {
+            'line': {'color': "red", 'width': 4},
+            'thickness': 0.75,
+            'value': 90
+        }
     }
-    return colors.get(match_level, 'secondary')
+)).update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20)).to_dict()
+
+_SKILLS_TEMPLATE = go.Figure(data=[
+    go.Bar(
+        x=['Matching Skills', 'Missing Skills'],
+        y=[0, 0],
+        marker_color=['#4caf50', '#f44336'],
+        text=[0, 0],
+        textposition='auto'
+    )
+]).update_layout(
+    title="Skills Overview",
+    height=300,
+    margin=dict(l=20, r=20, t=50, b=20),
+    yaxis_title="Count"
+).to_dict()
+
+
+def _gauge_figure(score):
+    """Build the match score gauge figure from its template."""
+    trace = {**_GAUGE_TEMPLATE['data'][0], 'value': score}
+    return {**_GAUGE_TEMPLATE, 'data': [trace]}
+
+
+def _skills_figure(matching_count, missing_count):
+    """Build the matching vs. missing skills bar chart from its template."""
+    counts = [matching_count, missing_count]
+    trace = {**_SKILLS_TEMPLATE['data'][0], 'y': counts, 'text': counts}
+    return {**_SKILLS_TEMPLATE, 'data': [trace]}
+
+
+def _escape_badge(text):
+    """Escape text from the documents for use inside raw HTML in Markdown."""
+    return _MARKDOWN_SPECIAL.sub(r'\\\1', escape_html(text))
+
+
+def _bullet_card(key, items, empty, ordered=False):
+    """Build a results card listing items as bullets, or a muted message if there are none."""
+    body: Component
+    if items:
+        body = (html.Ol if ordered else html.Ul)([html.Li(item) for item in items])
+    else:
+        body = html.P(empty, className="text-muted")
+    return dbc.Card([_CARD_HEADERS[key], dbc.CardBody([body])])
+
+
+def _badge_card(key, items, empty, color):
+    """Build a results card showing items as badges, or a muted message if there are none."""
+    body: Component
+    if items:
+        # A single Markdown component holding every badge, instead of one component per skill
+        body = dcc.Markdown(
+            "".join(f'<span class="badge bg-{color} me-2 mb-2">{_escape_badge(item)}</span>'
+                    for item in items),
+            dangerously_allow_html=True
+        )
+    else:
+        body = html.P(empty, className="text-muted")
+    return dbc.Card([_CARD_HEADERS[key], dbc.CardBody([body])])
+
+
+def create_results_layout(results, pending=False):
+    """
+    Create the results display layout.
 
+    Sections whose fields are not in results yet are left out, so partial
+    results can be shown while the analysis is still streaming in.
 
-def create_results_layout(results):
-    """Create the results display layout."""
+    Args:
+        results: Analysis results, complete or partial
+        pending: True while the analysis is still running
+    """
     if not results:
         return html.Div()
 
-    # Similarity score gauge
-    gauge_fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta",
-        value=results['similarity_score'],
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': "Match Score", 'font': {'size': 24}},
-        delta={'reference': 70, 'increasing': {'color': "green"}},
-        gauge={
-            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
-            'bar': {'color': "darkblue"},
-            'bgcolor': "white",
-            'borderwidth': 2,
-            'bordercolor': "gray",
-            'steps': [
-                {'range': [0, 50], 'color': '#ffebee'},
-                {'range': [50, 70], 'color': '#fff9c4'},
-                {'range': [70, 100], 'color': '#e8f5e9'}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 90
-            }
-        }
-    ))
-    gauge_fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
-
-    # Skills comparison chart
-    matching_count = len(results.get('matching_skills', []))
-    missing_count = len(results.get('missing_skills', []))
-
-    skills_fig = go.Figure(data=[
-        go.Bar(
-            x=['Matching Skills', 'Missing Skills'],
-            y=[matching_count, missing_count],
-            marker_color=['#4caf50', '#f44336'],
-            text=[matching_count, missing_count],
-            textposition='auto'
-        )
-    ])
-    skills_fig.update_layout(
-        title="Skills Overview",
-        height=300,
-        margin=dict(l=20, r=20, t=50, b=20),
-        yaxis_title="Count"
-    )
+    sections = [_RESULTS_TITLE]
 
-    return dbc.Container([
-        dbc.Row([
-            dbc.Col([
-                html.H3("📊 Analysis Results", className="mb-4")
-            ])
-        ]),
-
-        # Score and Charts
-        dbc.Row([
+    # Score and Charts
+    if 'similarity_score' in results:
+        charts = [
             dbc.Col([
                 dbc.Card([
                     dbc.CardBody([
-                        dcc.Graph(figure=gauge_fig, config={'displayModeBar': False})
+                        dcc.Graph(figure=_gauge_figure(results['similarity_score']),
+                                  config={'displayModeBar': False})
                     ])
                 ])
-            ], md=6),
-            dbc.Col([
+            ], md=6)
+        ]
+        if 'missing_skills' in results:
+            skills_fig = _skills_figure(
+                len(results.get('matching_skills', [])),
+                len(results.get('missing_skills', []))
+            )
+            charts.append(dbc.Col([
                 dbc.Card([
                     dbc.CardBody([
                         dcc.Graph(figure=skills_fig, config={'displayModeBar': False})
                     ])
                 ])
-            ], md=6)
-        ], className="mb-4"),
+            ], md=6))
+        sections.append(dbc.Row(charts, className="mb-4"))
 
-        # Overall Match Badge
-        dbc.Row([
+    # Overall Match Badge
+    if 'overall_match' in results:
+        sections.append(dbc.Row([
             dbc.Col([
                 dbc.Alert([
                     html.H4([
@@ -182,110 +297,73 @@ def create_results_layout(results):
                     ], className="mb-0")
                 ], color=get_match_color(results.get('overall_match', '')))
             ])
-        ], className="mb-4"),
+        ], className="mb-4"))
 
-        # Analysis Summary
-        dbc.Row([
+    # Analysis Summary
+    if 'analysis_summary' in results:
+        sections.append(dbc.Row([
             dbc.Col([
                 dbc.Card([
-                    dbc.CardHeader(html.H5("📝 Summary", className="mb-0")),
+                    _CARD_HEADERS['analysis_summary'],
                     dbc.CardBody([
                         html.P(results.get('analysis_summary', 'No summary available'))
                     ])
                 ])
             ])
-        ], className="mb-4"),
+        ], className="mb-4"))
 
-        # Key Strengths
-        dbc.Row([
+    # Key Strengths
+    if 'key_strengths' in results:
+        sections.append(dbc.Row([
             dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader(html.H5("✨ Key Strengths", className="mb-0")),
-                    dbc.CardBody([
-                        html.Ul([
-                            html.Li(strength) for strength in results.get('key_strengths', [])
-                        ]) if results.get('key_strengths') else html.P("No key strengths identified", className="text-muted")
-                    ])
-                ])
+                _bullet_card('key_strengths', results['key_strengths'], "No key strengths identified")
             ])
-        ], className="mb-4"),
-
-        # Skills Section
-        dbc.Row([
+        ], className="mb-4"))
+
+    # Skills Section
+    skill_columns = []
+    if 'matching_skills' in results:
+        skill_columns.append(dbc.Col([
+            _badge_card('matching_skills', results['matching_skills'], "No matching skills found", "success")
+        ], md=6))
+    if 'missing_skills' in results:
+        skill_columns.append(dbc.Col([
+            _badge_card('missing_skills', results['missing_skills'], "No missing skills identified", "danger")
+        ], md=6))
+    if skill_columns:
+        sections.append(dbc.Row(skill_columns, className="mb-4"))
+
+    # Partial Matches
+    if 'partial_matches' in results:
+        sections.append(dbc.Row([
             dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader(html.H5("✅ Matching Skills", className="mb-0")),
-                    dbc.CardBody([
-                        html.Div([
-                            dbc.Badge(skill, color="success", className="me-2 mb-2")
-                            for skill in results.get('matching_skills', [])
-                        ]) if results.get('matching_skills') else html.P("No matching skills found", className="text-muted")
-                    ])
-                ])
-            ], md=6),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader(html.H5("❌ Missing Skills", className="mb-0")),
-                    dbc.CardBody([
-                        html.Div([
-                            dbc.Badge(skill, color="danger", className="me-2 mb-2")
-                            for skill in results.get('missing_skills', [])
-                        ]) if results.get('missing_skills') else html.P("No missing skills identified", className="text-muted")
-                    ])
-                ])
-            ], md=6)
-        ], className="mb-4"),
-
-        # Partial Matches
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader(html.H5("⚠️ Partial Matches", className="mb-0")),
-                    dbc.CardBody([
-                        html.Ul([
-                            html.Li(match) for match in results.get('partial_matches', [])
-                        ]) if results.get('partial_matches') else html.P("No partial matches found", className="text-muted")
-                    ])
-                ])
+                _bullet_card('partial_matches', results['partial_matches'], "No partial matches found")
             ])
-        ], className="mb-4"),
+        ], className="mb-4"))
 
-        # Recommendations
-        dbc.Row([
+    # Recommendations
+    if 'recommendations' in results:
+        sections.append(dbc.Row([
             dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader(html.H5("💡 Recommendations", className="mb-0")),
-                    dbc.CardBody([
-                        html.Ol([
-                            html.Li(rec) for rec in results.get('recommendations', [])
-                        ]) if results.get('recommendations') else html.P("No recommendations available", className="text-muted")
-                    ])
-                ])
+                _bullet_card('recommendations', results['recommendations'],
+                             "No recommendations available", ordered=True)
             ])
-        ], className="mb-4"),
+        ], className="mb-4"))
 
+    if pending:
+        sections.append(_PENDING_ROW)
+    else:
         # Download Button
-        dbc.Row([
-            dbc.Col([
-                dbc.Button(
-                    [html.I(className="fas fa-download me-2"), "Download Results (JSON)"],
-                    id="download-button",
-                    color="success",
-                    size="lg",
-                    className="w-100"
-                )
-            ], md=6, className="mx-auto")
-        ]),
-
-        dcc.Download(id="download-json")
+        sections.append(_DOWNLOAD_ROW)
+        sections.append(dcc.Download(id="download-json"))
 
-    ], fluid=True, className="mt-4")
+    return dbc.Container(sections, fluid=True, className="mt-4")
 
 
 # Layout
 def layout():
     """Create the home page layout."""
-    if analyzer is None:
+    if get_analyzer() is None:
         return dbc.Container([
             dbc.Alert([
                 html.H4("⚠️ Configuration Required", className="alert-heading"),
@@ -338,7 +416,8 @@ def layout():
             children=html.Div(id="loading-output")
         ),
 
-        # Results section
+        # Partial results while an analysis is streaming in, then the final results
+        html.Div(id="results-progress", className="mt-4"),
         html.Div(id="results-section", className="mt-4"),
 
         # Store components for data
@@ -355,17 +434,19 @@ def layout():
      Output('job-content-store', 'data')],
     [Input('job-upload', 'contents'),
      Input('job-text', 'value')],
-    [State('job-upload', 'filename')]
+    [State('job-upload', 'filename')],
+    prevent_initial_call=True
 )
 def handle_job_input(upload_contents, text_value, filename):
     """Handle job description input (file or text) without tabs (dash pages)."""
-    if upload_contents:
+    # Only handle the input that changed, so editing the text never re-parses an upload
+    if ctx.triggered_id == 'job-upload' and upload_contents:
         content = parse_contents(upload_contents, filename or "uploaded_file")
         if content:
             return dbc.Alert(f"✓ Loaded: {filename or 'uploaded file'}", color="success", className="mt-2"), content
         else:
             return dbc.Alert("✗ Failed to load file", color="danger", className="mt-2"), None
-    elif text_value:
+    elif ctx.triggered_id == 'job-text' and text_value:
         return dbc.Alert("✓ Text loaded", color="success", className="mt-2"), text_value
 
     return no_update, None
@@ -376,18 +457,18 @@ def handle_job_input(upload_contents, text_value, filename):
      Output('resume-content-store', 'data')],
     [Input('resume-upload', 'contents'),
      Input('resume-text', 'value')],
-    [State('resume-upload', 'filename'),
-     State('resume-tabs', 'active_tab')]
+    [State('resume-upload', 'filename')],
+    prevent_initial_call=True
 )
-def handle_resume_input(upload_contents, text_value, filename, active_tab):
+def handle_resume_input(upload_contents, text_value, filename):
     """Handle resume input (file or text)."""
-    if active_tab == 'resume-upload-tab' and upload_contents:
+    if ctx.triggered_id == 'resume-upload' and upload_contents:
         content = parse_contents(upload_contents, filename)
         if content:
             return dbc.Alert(f"✓ Loaded: {filename}", color="success", className="mt-2"), content
         else:
             return dbc.Alert("✗ Failed to load file", color="danger", className="mt-2"), None
-    elif active_tab == 'resume-text-tab' and text_value:
+    elif ctx.triggered_id == 'resume-text' and text_value:
         return dbc.Alert("✓ Text loaded", color="success", className="mt-2"), text_value
 
     return no_update, None
@@ -400,10 +481,17 @@ def handle_resume_input(upload_contents, text_value, filename, active_tab):
     Input('analyze-button', 'n_clicks'),
     [State('job-content-store', 'data'),
      State('resume-content-store', 'data')],
+    background=True,
+    progress=[Output('results-progress', 'children')],
+    running=[
+        (Output('analyze-button', 'disabled'), True, False),
+        (Output('results-progress', 'style'), {'display': 'block'}, {'display': 'none'}),
+        (Output('results-section', 'style'), {'display': 'none'}, {'display': 'block'}),
+    ],
     prevent_initial_call=True
 )
-def analyze_resume(n_clicks, job_content, resume_content):
-    """Perform resume analysis."""
+def analyze_resume(set_progress, n_clicks, job_content, resume_content):
+    """Perform resume analysis, showing results as they stream in."""
     if not n_clicks:
         raise PreventUpdate
 
@@ -413,6 +501,7 @@ def analyze_resume(n_clicks, job_content, resume_content):
             color="warning"
         ), None, None
 
+    analyzer = get_analyzer()
     if analyzer is None:
         return dbc.Alert(
             "⚠️ OpenAI API key not configured",
@@ -420,8 +509,18 @@ def analyze_resume(n_clicks, job_content, resume_content):
         ), None, None
 
     try:
-        # Perform analysis
-        results = analyzer.analyze(job_content, resume_content)
+        # Background callbacks run in a new process for every click, so this
+        # analyzer's HTTP connections only last for one analysis. Its results
+        # cache is on disk and shared: a previous analysis of the same
+        # documents is returned from it.
+        set_progress((_PENDING_ROW,))
+        results = analyzer.analyze(
+            job_content,
+            resume_content,
+            on_progress=lambda partial: set_progress(
+                (create_results_layout(partial, pending=True),)
+            )
+        )
 
         # Create results layout
         results_layout = create_results_layout(results)
@@ -435,57 +534,99 @@ def analyze_resume(n_clicks, job_content, resume_content):
         ), None, None
 
 
-@callback(
+# Download runs in the browser: the results are already in the store on the client
+clientside_callback(
+    """
+    function(n_clicks, results) {
+        if (!n_clicks || !results) {
+            return window.dash_clientside.no_update;
+        }
+        const now = new Date();
+        const pad = (value) => String(value).padStart(2, '0');
+        const timestamp = `${now.getFullYear()}${pad(now.getMonth() + 1)}${pad(now.getDate())}_` +
+            `${pad(now.getHours())}${pad(now.getMinutes())}${pad(now.getSeconds())}`;
+        return {
+            content: JSON.stringify(results, null, 2),
+            filename: `resume_analysis_${timestamp}.json`
+        };
+    }
+    """,
     Output('download-json', 'data'),
     Input('download-button', 'n_clicks'),
     State('analysis-results-store', 'data'),
     prevent_initial_call=True
 )
-def download_results(n_clicks, results):
-    """Download analysis results as JSON."""
-    if not n_clicks or not results:
-        raise PreventUpdate
 
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"resume_analysis_{timestamp}.json"
 
-    return dict(
-        content=json.dumps(results, indent=2),
-        filename=filename
-    )
+# Text extracted from recent PDF/DOCX uploads, keyed by a digest of the file's
+# bytes. Kept in memory only, since uploaded documents are never written to disk.
+TEXT_CACHE_SIZE = 64
+_text_cache: OrderedDict[tuple[str, bytes], str] = OrderedDict()
+_text_cache_lock = threading.Lock()
+
+
+def _cache_by_content(parser):
+    """Reuse the text a parser extracted earlier from an identical upload."""
+    @functools.wraps(parser)
+    def cached_parser(data):
+        key = (parser.__name__, hashlib.blake2b(data, digest_size=16).digest())
+        with _text_cache_lock:
+            if key in _text_cache:
+                _text_cache.move_to_end(key)
+                return _text_cache[key]
+
+        text = parser(data)
+        with _text_cache_lock:
+            _text_cache[key] = text
+            if len(_text_cache) > TEXT_CACHE_SIZE:
+                _text_cache.popitem(last=False)
+        return text
+
+    return cached_parser
+
+
+def _parse_txt(data):
+    """Decode an uploaded text file."""
+    return data.decode('utf-8')
+
+
+@_cache_by_content
+def _parse_pdf(data):
+    """Extract text from an uploaded PDF, straight from memory."""
+    return get_analyzer()._extract_from_pdf(io.BytesIO(data))
+
+
+@_cache_by_content
+def _parse_docx(data):
+    """Extract text from an uploaded DOCX, straight from memory."""
+    return get_analyzer()._extract_from_docx(io.BytesIO(data))
+
+
+# Upload parsers by file extension; each takes the decoded file bytes and returns text
+_UPLOAD_PARSERS = {
+    '.txt': _parse_txt,
+    '.pdf': _parse_pdf,
+    '.docx': _parse_docx,
+}
 
 
 def parse_contents(contents, filename):
     """Parse uploaded file contents."""
+    # Reject unsupported file types before decoding anything
+    parser = _UPLOAD_PARSERS.get(Path(filename or '').suffix.lower())
+    if parser is None:
+        return None
+
     try:
         content_type, content_string = contents.split(',')
-        decoded = base64.b64decode(content_string)
-
-        if filename.endswith('.txt'):
-            return decoded.decode('utf-8')
-
-        elif filename.endswith('.pdf'):
-            # Save temporarily and extract
-            temp_path = f"./tmp/{filename}"
-            with open(temp_path, 'wb') as f:
-                f.write(decoded)
-            text = analyzer._extract_from_pdf(temp_path)
-            os.remove(temp_path)
-            return text
-
-        elif filename.endswith('.docx'):
-            # Save temporarily and extract
-            temp_path = f"./tmp/{filename}"
-            with open(temp_path, 'wb') as f:
-                f.write(decoded)
-            text = analyzer._extract_from_docx(temp_path)
-            os.remove(temp_path)
-            return text
 
-        else:
+        # Every 4 base64 characters encode 3 bytes; refuse oversized files undecoded
+        if len(content_string) * 3 // 4 > MAX_UPLOAD_BYTES:
+            print(f"Error parsing file: {filename} is larger than {MAX_UPLOAD_BYTES} bytes")
             return None
 
+        return parser(base64.b64decode(content_string))
+
     except Exception as e:
         print(f"Error parsing file: {str(e)}")
         return None
@@ -0,0 +1,5 @@
+"""
+Resume Analyzer - Compares job descriptions with resumes using OpenAI API
+"""
+
+from .resume_analyzer import ResumeAnalyzer, main
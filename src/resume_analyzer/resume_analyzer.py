@@ -3,40 +3,481 @@ Resume Analyzer - Compares job descriptions with resumes using OpenAI API
 Provides similarity scores, matching/missing skills, and improvement recommendations
 """
 
+import io
 import os
+import stat
 import json
+import logging
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import multiprocessing
+import zipfile
+import xml.etree.ElementTree as ElementTree
 import re
-from typing import Dict, List, Tuple
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from dotenv import load_dotenv
+import diskcache
 
 # Document processing libraries
 import PyPDF2
 from docx import Document
 import pdfplumber
 
+try:
+    import orjson  # Optional, from the "speedups" extra
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# PDF text extraction backends, fastest first. pypdfium2 is installed with
+# pdfplumber; PyMuPDF is optional (pip install "resume-analyzer[pymupdf]").
+# Set PDF_BACKEND to force one.
+PDF_BACKENDS = ('pdfium', 'pymupdf', 'pdfplumber', 'pypdf2')
+PDF_BACKEND = os.getenv('PDF_BACKEND', 'auto').lower()
+
+# Neither PDFium nor MuPDF is thread-safe; PDFium crashes the process when two
+# threads use it at once (e.g. two uploads in one threaded Gunicorn worker), so
+# every call into either library holds this lock
+_NATIVE_PDF_LOCK = threading.Lock()
+
+# Resumes sharing less than this fraction of distinct words with the job
+# description (measured on the shorter of the two) are reported as a poor match
+# without an API call. Documents with fewer than MIN_FILTER_TOKENS distinct
+# words are too short to judge and always go to the model.
+MIN_TOKEN_OVERLAP = 0.05
+MIN_FILTER_TOKENS = 20
+
+# The single tokenizer for every local text comparison: document overlap, the
+# skills vocabulary and skill names. Applied to lower-cased text. Words may
+# contain '+' and '#' after the first character (C++, C#); Chinese and Japanese
+# are written without spaces, so each of their characters is its own token.
+# Character classes only, so matching is linear even on hostile input.
+_CJK_CHARS = '\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+_TOKEN_RE = re.compile(rf'[{_CJK_CHARS}]|[^\W{_CJK_CHARS}](?:[^\W{_CJK_CHARS}]|[+#])*')
+
+# Text extractor method for each file extension
+_EXT_HANDLERS = {
+    '.pdf': '_extract_from_pdf',
+    '.docx': '_extract_from_docx',
+    '.txt': '_extract_from_txt',
+    '.text': '_extract_from_txt',
+}
+
+# WordprocessingML tags read by the streaming DOCX reader
+_W_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_PARAGRAPH = _W_NAMESPACE + 'p'
+_W_RUN = _W_NAMESPACE + 'r'
+_W_TEXT = _W_NAMESPACE + 't'
+_W_TAB = _W_NAMESPACE + 'tab'
+_W_BREAKS = frozenset((_W_NAMESPACE + 'br', _W_NAMESPACE + 'cr'))
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+# HTTP/2 lets concurrent requests share one connection; it needs the optional
+# h2 package (pip install "resume-analyzer[speedups]")
+HTTP2 = importlib.util.find_spec('h2') is not None
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+
+# pdfplumber splits PDFs with at least this many pages across worker processes,
+# taken from one pool of at most PDF_PARALLEL_WORKERS processes per process
+PDF_PARALLEL_MIN_PAGES = 4
+PDF_PARALLEL_WORKERS = min(4, os.cpu_count() or 1)
+
+_pdfplumber_pool_lock = threading.Lock()
+_pdfplumber_pool_owner: Optional[Tuple[int, ProcessPoolExecutor]] = None
+
+# The prompt keeps every static instruction in the system message and leaves
+# the documents for the end of the request, so OpenAI's prompt caching can
+# reuse the shared prefix across analyses.
+ANALYSIS_PROMPT = """You are an expert ATS (Applicant Tracking System), technical recruiter and resume writer.
+
+Analyze the job description and resume provided by the user and fill in every field of the response:
+
+1. Similarity: a similarity score between 0 and 100, the overall match (Poor/Fair/Good/Excellent),
+   a brief summary of how well the resume matches the job, and the resume's key strengths for this job.
+2. Skills: identify the technical skills, tools, and technologies mentioned in the job description.
+   List which of them are present in the resume (matching skills), which required/preferred skills
+   are missing from the resume (missing skills), and partial matches as "skill: explanation".
+   Be specific and list actual skill names (e.g., "Python", "AWS", "Agile", "Leadership").
+3. Recommendations: 5-8 specific, actionable recommendations to improve the resume, taking the
+   missing skills into account. Focus on:
+   - How to highlight relevant experience better
+   - Keywords to add (if genuinely applicable)
+   - Format/structure improvements
+   - Ways to address missing skills
+   - Quantifying achievements
+   - Tailoring the resume to the job
+
+Be objective and thorough in your assessment."""
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Structured output schema for ANALYSIS_PROMPT. Fields are listed in display
+# order, which is also the order they stream in.
+ANALYSIS_RESPONSE_FORMAT: Dict = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "resume_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "similarity_score": {"type": "number", "description": "Score between 0 and 100"},
+                "overall_match": {"type": "string", "enum": ["Poor", "Fair", "Good", "Excellent"]},
+                "analysis_summary": {"type": "string"},
+                "key_strengths": _STRING_LIST,
+                "matching_skills": _STRING_LIST,
+                "partial_matches": _STRING_LIST,
+                "missing_skills": _STRING_LIST,
+                "recommendations": _STRING_LIST
+            },
+            "required": [
+                "similarity_score", "overall_match", "analysis_summary", "key_strengths",
+                "matching_skills", "partial_matches", "missing_skills", "recommendations"
+            ],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Fields of the analysis results, in the order they are displayed
+RESULT_SECTIONS = tuple(ANALYSIS_RESPONSE_FORMAT["json_schema"]["schema"]["properties"])
+
+# Parses complete JSON replies
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Used by _compact to trim documents before they are sent to the model
+_URL_RE = re.compile(r'(?:https?://|www\.)\S+')
+_SPACES_RE = re.compile(r'[^\S\n]+')
+_REPEATED_LINE_MIN = 3
+
+# Used to read the top-level fields of streamed JSON replies
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r'\s*')
+_JSON_SEPARATORS = re.compile(r'[\s,]*')
+
+
+def _compact(text: str) -> str:
+    """
+    Shrink document text before it is sent to the model.
+
+    Removes URLs, collapses runs of spaces and tabs, drops blank lines, and keeps
+    only the first copy of lines repeated _REPEATED_LINE_MIN or more times
+    (typically page headers and footers).
+    """
+    lines = [_SPACES_RE.sub(' ', _URL_RE.sub('', line)).strip() for line in text.splitlines()]
+    counts = Counter(lines)
+    seen = set()
+    kept = []
+    for line in lines:
+        if not line:
+            continue
+        if counts[line] >= _REPEATED_LINE_MIN:
+            if line in seen:
+                continue
+            seen.add(line)
+        kept.append(line)
+    return "\n".join(kept)
+
+
+def _documents_message(job_description: str, resume: str) -> str:
+    """Format the job description and resume as the user message of a prompt."""
+    # The resume goes last: screening several resumes against one job then shares
+    # the whole system prompt + job description prefix, which OpenAI caches
+    return f"JOB DESCRIPTION:\n{_compact(job_description)}\n\nRESUME:\n{_compact(resume)}"
+
+
+def _prompt_cache_key(job_description: str) -> str:
+    """Return the OpenAI prompt cache key for requests about one job description."""
+    return "jd-" + hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _skip(pattern: re.Pattern[str], buffer: str, index: int) -> int:
+    """Return the index just past what pattern (which may match nothing) matches at index."""
+    match = pattern.match(buffer, index)
+    return match.end() if match else index
+
+
+def _parse_partial_json(buffer: str) -> Dict:
+    """
+    Parse the complete top-level fields of a JSON object that is still streaming in.
+
+    Fields whose value has not fully arrived yet are left out.
+    """
+    fields: Dict = {}
+    index = buffer.find('{') + 1
+    if not index:
+        return fields
+
+    try:
+        while True:
+            index = _skip(_JSON_SEPARATORS, buffer, index)
+            key, index = _JSON_DECODER.raw_decode(buffer, index)
+            index = _skip(_JSON_WHITESPACE, buffer, index)
+            if buffer[index:index + 1] != ':':
+                break
+            index = _skip(_JSON_WHITESPACE, buffer, index + 1)
+            value, index = _JSON_DECODER.raw_decode(buffer, index)
+            # A number or literal at the very end may still be growing
+            if index >= len(buffer):
+                break
+            fields[key] = value
+    except json.JSONDecodeError:
+        pass
+    return fields
+
+
+def _regular_file_stat(file_path: str) -> Optional[os.stat_result]:
+    """Return the stat result for file_path if it is a regular file, else None."""
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):  # Missing, invalid or overlong path
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
+def _normalize_skill(skill: str) -> str:
+    """Return a skill name reduced to its lower-cased words, e.g. 'Node.js' -> 'node js'."""
+    return " ".join(_TOKEN_RE.findall(skill.lower()))
+
+
+def _normalize_skills(skills: List[str]) -> frozenset:
+    """Return a set of normalized skill names for case- and punctuation-insensitive comparison."""
+    return frozenset(filter(None, map(_normalize_skill, skills)))
+
+
+def _open_pdfplumber(pdf_data: Union[str, bytes]) -> pdfplumber.PDF:
+    """Open a PDF with pdfplumber, given its path or its raw bytes."""
+    return pdfplumber.open(io.BytesIO(pdf_data) if isinstance(pdf_data, bytes) else pdf_data)
+
+
+def _extract_pdfplumber_pages(pdf_data: Union[str, bytes], start: int, stop: int) -> List[str]:
+    """Extract the text of pages start to stop-1 with pdfplumber (runs in a worker process)."""
+    with _open_pdfplumber(pdf_data) as pdf:
+        return [pdf.pages[index].extract_text() for index in range(start, stop)]
+
+
+def _pdfplumber_pool() -> ProcessPoolExecutor:
+    """
+    Return this process's pool of pdfplumber worker processes, created on first use.
+
+    The pool is shared by all threads. Workers are spawned rather than forked:
+    forking a process that runs other threads (like a threaded Gunicorn worker)
+    can deadlock the child.
+    """
+    global _pdfplumber_pool_owner
+    with _pdfplumber_pool_lock:
+        # A pool inherited through fork belongs to the parent process
+        if _pdfplumber_pool_owner is None or _pdfplumber_pool_owner[0] != os.getpid():
+            pool = ProcessPoolExecutor(
+                max_workers=PDF_PARALLEL_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _pdfplumber_pool_owner = (os.getpid(), pool)
+        return _pdfplumber_pool_owner[1]
+
+
+def _token_overlap(job_description: str, resume: str) -> Optional[float]:
+    """
+    Return the share of the shorter document's distinct words found in the other.
+
+    Measuring against the shorter document keeps a brief job description from
+    looking unrelated to a long resume. Returns None if either document has
+    fewer than MIN_FILTER_TOKENS distinct words.
+    """
+    job_tokens = set(_TOKEN_RE.findall(job_description.lower()))
+    resume_tokens = set(_TOKEN_RE.findall(resume.lower()))
+    smaller = min(len(job_tokens), len(resume_tokens))
+    if smaller < MIN_FILTER_TOKENS:
+        return None
+    return len(job_tokens & resume_tokens) / smaller
+
+
+def _is_unrelated(job_description: str, resume: str) -> bool:
+    """Return whether a resume is clearly unrelated to the job description."""
+    overlap = _token_overlap(job_description, resume)
+    return overlap is not None and overlap < MIN_TOKEN_OVERLAP
+
+
+@functools.cache
+def _skills_vocabulary() -> Tuple[Dict[Tuple[str, ...], str], int]:
+    """
+    Load skills.txt as a lookup of word sequences to skill names.
+
+    Returns:
+        The lookup, and the number of words in the longest skill name
+    """
+    vocabulary = {}
+    for line in Path(__file__).with_name('skills.txt').read_text('utf-8').splitlines():
+        skill = line.strip()
+        if skill and not skill.startswith('#'):
+            vocabulary[tuple(_TOKEN_RE.findall(skill.lower()))] = skill
+    return vocabulary, max(map(len, vocabulary))
+
+
+def _unrelated_results() -> Dict:
+    """Return the results reported for a resume unrelated to the job description."""
+    return _compile_results({
+        'similarity_score': 0,
+        'overall_match': 'Poor',
+        'analysis_summary': "The resume has almost no words in common with the job description, "
+                            "so it was not analyzed further.",
+        'recommendations': ["Check that the right resume and job description were provided, "
+                            "then tailor the resume to the job description."]
+    })
+
+
+def _stream_docx_text(source: Union[str, BinaryIO]) -> str:
+    """
+    Read the text of a DOCX file by streaming word/document.xml.
+
+    Paragraphs, including those in table cells and text boxes, are returned in
+    the order they end, one per line; empty paragraphs are skipped. Tabs and
+    line breaks inside runs are kept, like python-docx's Paragraph.text.
+    """
+    paragraphs = []
+    # One text buffer per open paragraph: a text box paragraph is nested inside
+    # the paragraph it is anchored to, and each keeps its own text
+    buffers: List[List[str]] = []
+    run_depth = 0
+    fallback_depth = 0
+    with zipfile.ZipFile(source) as archive, archive.open('word/document.xml') as xml:
+        for event, element in ElementTree.iterparse(xml, events=('start', 'end')):
+            tag = element.tag
+            if tag == _MC_FALLBACK:
+                # Word saves text boxes twice: in mc:Choice and again in mc:Fallback
+                # for older readers. Only read the first copy.
+                fallback_depth += 1 if event == 'start' else -1
+                if event == 'end':
+                    element.clear()
+            elif fallback_depth:
+                continue
+            elif tag == _W_RUN:
+                run_depth += 1 if event == 'start' else -1
+            elif tag == _W_PARAGRAPH:
+                if event == 'start':
+                    buffers.append([])
+                    continue
+                paragraph_text = ''.join(buffers.pop())
+                if paragraph_text.strip():
+                    paragraphs.append(paragraph_text)
+                # Finished paragraphs are not needed again; keep memory flat
+                element.clear()
+            elif event == 'start' or not buffers:
+                continue
+            elif tag == _W_TEXT:
+                buffers[-1].append(element.text or '')
+            elif run_depth and tag == _W_TAB:  # Outside runs, w:tab is a tab stop definition
+                buffers[-1].append('\t')
+            elif run_depth and tag in _W_BREAKS:
+                buffers[-1].append('\n')
+    return "\n".join(paragraphs)
+
+
+def _compile_results(result: Dict) -> Dict:
+    """Fill in defaults for any field missing from an analysis reply."""
+    return {
+        'similarity_score': result.get('similarity_score', 0),
+        'overall_match': result.get('overall_match', 'Unknown'),
+        'key_strengths': result.get('key_strengths', []),
+        'analysis_summary': result.get('analysis_summary', ''),
+        'matching_skills': result.get('matching_skills', []),
+        'missing_skills': result.get('missing_skills', []),
+        'partial_matches': result.get('partial_matches', []),
+        'recommendations': result.get('recommendations', [])
+    }
+
 
 class ResumeAnalyzer:
     """Analyzes resumes against job descriptions using OpenAI's GPT models."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache_dir: Optional[str] = ".resume_cache"):
         """
         Initialize the analyzer with OpenAI API key.
 
         Args:
             api_key: OpenAI API key (optional if set in environment)
+            cache_dir: Directory of the persistent results cache, or None to disable caching
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OpenAI API key must be provided or set in OPENAI_API_KEY environment variable")
 
-        self.client = OpenAI(api_key=self.api_key)
+        # Clients keep their connections open, so reuse one analyzer for many analyses
+        self.client = OpenAI(
+            api_key=self.api_key,
+            http_client=DefaultHttpxClient(http2=HTTP2, limits=_HTTP_LIMITS)
+        )
+        self._aclient: Optional[AsyncOpenAI] = None  # Created on first async use
         self.model = "gpt-4o-mini"  # Latest stable model, cost-effective
 
+        # Text extracted from files, by absolute path: ((mtime_ns, size), text)
+        self._text_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+        # Results of previous analyses, so repeated inputs skip the API entirely
+        self.cache = None
+        if cache_dir is not None:
+            self.cache = diskcache.Cache(cache_dir, eviction_policy='least-recently-used')
+
+    def _async_client(self) -> AsyncOpenAI:
+        """Create an AsyncOpenAI client with the same connection settings as self.client."""
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=DefaultAsyncHttpxClient(http2=HTTP2, limits=_HTTP_LIMITS)
+        )
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """The AsyncOpenAI client used by analyze_async(), created on first use."""
+        if self._aclient is None:
+            self._aclient = self._async_client()
+        return self._aclient
+
+    def close(self) -> None:
+        """
+        Close the HTTP clients and the results cache.
+
+        Inside a running event loop, use aclose() instead once analyze_async()
+        has been used.
+        """
+        if self._aclient is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self._aclient.close())
+            else:
+                raise RuntimeError("Use 'await analyzer.aclose()' inside a running event loop")
+            self._aclient = None
+
+        self.client.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    async def aclose(self) -> None:
+        """Close everything close() does, from inside a running event loop."""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+        self.close()
+
+    def __enter__(self) -> "ResumeAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def extract_text_from_file(self, file_path: str) -> str:
         """
         Extract text from various file formats (txt, pdf, docx).
@@ -50,11 +491,35 @@ class ResumeAnalyzer:
         Supported formats: .txt, .pdf, .docx
         Note: .doc files are not supported. Please convert to .docx format.
         """
-        if not os.path.exists(file_path):
+        file_stat = _regular_file_stat(file_path)
+        if file_stat is None:
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        return self._read_file(Path(file_path), file_stat)
+
+    def _read_file(self, path: Path, file_stat: os.stat_result) -> str:
+        """
+        Extract text from a file that is known to exist.
+
+        Text is cached per file and reused until the file's modification time
+        or size changes.
+        """
+        cache_key = os.path.abspath(path)
+        version = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._text_cache.get(cache_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        text = self._extract_text(path)
+        self._text_cache[cache_key] = (version, text)
+        return text
+
+    def _extract_text(self, path: Path) -> str:
+        """Extract text from a file, picking the extractor by file extension."""
+        file_path = str(path)
+
         # Get file extension
-        file_extension = Path(file_path).suffix.lower()
+        file_extension = path.suffix.lower()
 
         # Check for unsupported .doc format
         if file_extension == '.doc':
@@ -64,21 +529,9 @@ class ResumeAnalyzer:
             )
 
         try:
-            # PDF files
-            if file_extension == '.pdf':
-                return self._extract_from_pdf(file_path)
-
-            # DOCX files
-            elif file_extension == '.docx':
-                return self._extract_from_docx(file_path)
-
-            # Text files
-            elif file_extension in ['.txt', '.text']:
-                return self._extract_from_txt(file_path)
-
-            else:
-                # Try reading as text file by default
-                return self._extract_from_txt(file_path)
+            # Unknown extensions are read as text files
+            handler = _EXT_HANDLERS.get(file_extension, '_extract_from_txt')
+            return getattr(self, handler)(file_path)
 
         except Exception as e:
             raise Exception(f"Error reading file {file_path}: {str(e)}")
@@ -93,55 +546,158 @@ class ResumeAnalyzer:
             with open(file_path, 'r', encoding='latin-1') as f:
                 return f.read()
 
-    def _extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF files using multiple methods for better accuracy."""
-        text = ""
+    def _extract_from_pdf(self, source: Union[str, BinaryIO],
+                          force_backend: Optional[str] = None) -> str:
+        """
+        Extract text from PDF files using multiple methods for better accuracy.
 
-        # Method 1: Try pdfplumber first (better for complex PDFs)
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+        Backends are tried in order until one returns text: pypdfium2, PyMuPDF
+        if installed, then pdfplumber and PyPDF2. Set the PDF_BACKEND environment
+        variable to use a single backend only.
 
-            if text.strip():
-                return text
-        except Exception as e:
-            print(f"Warning: pdfplumber failed, trying PyPDF2: {str(e)}")
+        Args:
+            source: Path to the PDF file, or a binary file-like object (e.g. io.BytesIO)
+            force_backend: Backend to use instead of PDF_BACKEND ('auto' or one of PDF_BACKENDS)
+        """
+        setting = (force_backend or PDF_BACKEND).lower()
+        backends: Tuple[str, ...]
+        if setting == 'auto':
+            backends = PDF_BACKENDS
+        elif setting in PDF_BACKENDS:
+            backends = (setting,)
+        else:
+            raise ValueError(
+                f"Unknown PDF backend '{setting}'. "
+                f"Use 'auto' or one of: {', '.join(PDF_BACKENDS)}"
+            )
 
-        # Method 2: Fallback to PyPDF2
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n"
+        error = None
+        for backend in backends:
+            if not isinstance(source, str):
+                source.seek(0)
+            try:
+                text = getattr(self, f"_extract_pdf_with_{backend}")(source)
+            except ImportError:
+                if setting != 'auto':
+                    raise Exception(f"PDF backend '{backend}' is not installed")
+                continue  # Optional backend not installed, try the next one
+            except Exception as e:
+                logger.warning("%s failed: %s", backend, e)
+                error = e
+                continue
 
             if text.strip():
                 return text
+
+        reason = str(error) if error else "No text could be extracted from PDF"
+        raise Exception(f"Failed to extract text from PDF: {reason}")
+
+    def _extract_pdf_with_pdfium(self, source: Union[str, BinaryIO]) -> str:
+        """Extract PDF text with pypdfium2 (PDFium, compiled C++)."""
+        import pypdfium2 as pdfium
+
+        with _NATIVE_PDF_LOCK:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                pages = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range().replace('\r\n', '\n'))
+                    textpage.close()
+                    page.close()
+                return "\n".join(pages)
+            finally:
+                pdf.close()
+
+    def _extract_pdf_with_pymupdf(self, source: Union[str, BinaryIO]) -> str:
+        """Extract PDF text with PyMuPDF (MuPDF, compiled C), if installed."""
+        import pymupdf
+
+        with _NATIVE_PDF_LOCK:
+            if isinstance(source, str):
+                doc = pymupdf.open(source)
             else:
-                raise Exception("No text could be extracted from PDF")
+                doc = pymupdf.open(stream=source.read(), filetype="pdf")
+            with doc:
+                return "\n".join(page.get_text() for page in doc)
+
+    def _extract_pdf_with_pdfplumber(self, source: Union[str, BinaryIO]) -> str:
+        """
+        Extract PDF text with pdfplumber (better for complex layouts).
+
+        pdfplumber is pure Python and CPU-bound, so longer PDFs are split into
+        page ranges that are extracted in parallel by the shared worker pool.
+        """
+        # Worker processes reopen the PDF themselves, so keep a path or the raw bytes
+        pdf_data = source if isinstance(source, str) else source.read()
+        with _open_pdfplumber(pdf_data) as pdf:
+            page_count = len(pdf.pages)
+            workers = min(PDF_PARALLEL_WORKERS, page_count)
+            if page_count < PDF_PARALLEL_MIN_PAGES or workers < 2:
+                page_texts = [page.extract_text() for page in pdf.pages]
+            else:
+                page_texts = None
+
+        if page_texts is None:
+            bounds = [page_count * worker // workers for worker in range(workers + 1)]
+            pool = _pdfplumber_pool()
+            futures = [
+                pool.submit(_extract_pdfplumber_pages, pdf_data, start, stop)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+            page_texts = [page_text for future in futures for page_text in future.result()]
+
+        # Join once at the end; repeated += on a str copies the text for every page
+        return "".join(page_text + "\n" for page_text in page_texts if page_text)
+
+    def _extract_pdf_with_pypdf2(self, source: Union[str, BinaryIO]) -> str:
+        """Extract PDF text with PyPDF2."""
+        opened = open(source, 'rb') if isinstance(source, str) else nullcontext(source)
+        with opened as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
+
+    def _extract_from_docx(self, source: Union[str, BinaryIO]) -> str:
+        """
+        Extract text from DOCX files.
+
+        The document XML is streamed straight out of the archive, which avoids
+        building python-docx's object model. python-docx is used as a fallback
+        for files the streaming reader cannot handle.
+
+        Args:
+            source: Path to the DOCX file, or a binary file-like object (e.g. io.BytesIO)
+        """
+        try:
+            return _stream_docx_text(source)
         except Exception as e:
-            raise Exception(f"Failed to extract text from PDF: {str(e)}")
+            logger.warning("Streaming DOCX reader failed: %s", e)
+
+        if not isinstance(source, str):
+            source.seek(0)
 
-    def _extract_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX files."""
         try:
-            doc = Document(file_path)
+            doc = Document(source)
             text = []
 
-            # Extract paragraphs
+            # Extract paragraphs (.text rebuilds the string on each access, so read it once)
             for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text.append(paragraph.text)
+                paragraph_text = paragraph.text
+                if paragraph_text.strip():
+                    text.append(paragraph_text)
 
-            # Extract text from tables
+            # Extract text from tables. Merged cells are returned once per grid
+            # position they span, so only read each underlying cell once.
             for table in doc.tables:
+                seen_cells = set()
                 for row in table.rows:
                     for cell in row.cells:
-                        if cell.text.strip():
-                            text.append(cell.text)
+                        if cell._tc in seen_cells:
+                            continue
+                        seen_cells.add(cell._tc)
+                        cell_text = cell.text
+                        if cell_text.strip():
+                            text.append(cell_text)
 
             return "\n".join(text)
         except Exception as e:
@@ -166,7 +722,7 @@ class ResumeAnalyzer:
             except ImportError:
                 pass  # pywin32 not installed, try other methods
             except Exception as e:
-                print(f"Warning: Failed to extract using pywin32: {str(e)}")
+                logger.warning("Failed to extract using pywin32: %s", e)
 
         # Method 2: Try using antiword (Linux/Mac command-line tool)
         try:
@@ -180,9 +736,9 @@ class ResumeAnalyzer:
         except FileNotFoundError:
             pass  # antiword not installed
         except subprocess.CalledProcessError as e:
-            print(f"Warning: antiword failed: {str(e)}")
+            logger.warning("antiword failed: %s", e)
         except Exception as e:
-            print(f"Warning: antiword error: {str(e)}")
+            logger.warning("antiword error: %s", e)
 
         # Method 3: Try using LibreOffice in headless mode (cross-platform)
         try:
@@ -207,7 +763,7 @@ class ResumeAnalyzer:
         except subprocess.CalledProcessError:
             pass  # Conversion failed
         except Exception as e:
-            print(f"Warning: LibreOffice conversion failed: {str(e)}")
+            logger.warning("LibreOffice conversion failed: %s", e)
 
         # Method 4: Try using pypandoc
         try:
@@ -217,7 +773,7 @@ class ResumeAnalyzer:
         except ImportError:
             pass  # pypandoc not installed
         except Exception as e:
-            print(f"Warning: pypandoc failed: {str(e)}")
+            logger.warning("pypandoc failed: %s", e)
 
         # If all methods fail, provide helpful error message
         raise Exception(
@@ -230,175 +786,266 @@ class ResumeAnalyzer:
             "\nNote: .docx files are fully supported without additional dependencies."
         )
 
-    def calculate_similarity_score(self, job_description: str, resume: str) -> Dict:
+    def _chat_request(self, system_prompt: str, user_message: str, temperature: float,
+                      response_format: Optional[Dict] = None,
+                      prompt_cache_key: Optional[str] = None) -> Dict:
+        """Build the keyword arguments for a chat completion request."""
+        request = dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=temperature,
+            response_format=response_format or {"type": "json_object"}
+        )
+        if prompt_cache_key:
+            request['prompt_cache_key'] = prompt_cache_key
+        return request
+
+    def _request_json(self, system_prompt: str, user_message: str, temperature: float,
+                      on_partial: Optional[Callable[[Dict], None]] = None,
+                      response_format: Optional[Dict] = None,
+                      prompt_cache_key: Optional[str] = None) -> Dict:
         """
-        Calculate similarity score between job description and resume.
+        Send a chat completion request and parse its JSON reply.
 
         Args:
-            job_description: Job description text
-            resume: Resume text
+            system_prompt: Static instructions for the model
+            user_message: Documents to analyze
+            temperature: Sampling temperature
+            on_partial: Optional callback; when given, the reply is streamed and the
+                callback receives the fields parsed so far each time another one completes
+            response_format: OpenAI response format (defaults to any JSON object)
+            prompt_cache_key: Groups requests sharing a prompt prefix, so OpenAI
+                routes them to the same prompt cache
 
         Returns:
-            Dictionary containing similarity analysis
+            Parsed JSON reply
         """
-        prompt = f"""
-You are an expert ATS (Applicant Tracking System) and recruitment specialist.
+        request = self._chat_request(system_prompt, user_message, temperature,
+                                     response_format, prompt_cache_key)
+
+        if on_partial is None:
+            response = self.client.chat.completions.create(**request)
+            return _json_loads(response.choices[0].message.content)
+
+        buffer = ""
+        completed = 0
+        for chunk in self.client.chat.completions.create(stream=True, **request):
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            buffer += chunk.choices[0].delta.content
+            fields = _parse_partial_json(buffer)
+            if len(fields) > completed:
+                completed = len(fields)
+                on_partial(fields)
+
+        return _json_loads(buffer)
+
+    async def _request_json_async(self, client: AsyncOpenAI, system_prompt: str,
+                                  user_message: str, temperature: float,
+                                  response_format: Optional[Dict] = None,
+                                  prompt_cache_key: Optional[str] = None) -> Dict:
+        """Async version of _request_json, sent through the given AsyncOpenAI client."""
+        response = await client.chat.completions.create(
+            **self._chat_request(system_prompt, user_message, temperature,
+                                 response_format, prompt_cache_key)
+        )
+        return _json_loads(response.choices[0].message.content)
 
-Analyze the following job description and resume, then provide a detailed similarity score and analysis.
+    def _analyze_documents(self, job_description: str, resume: str,
+                           on_partial: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Request the score, skills and recommendations together in one API call.
 
-JOB DESCRIPTION:
-{job_description}
+        Args:
+            job_description: Job description text
+            resume: Resume text
+            on_partial: Optional callback receiving fields as they stream in
 
-RESUME:
-{resume}
+        Returns:
+            Dictionary with every field of ANALYSIS_RESPONSE_FORMAT
+        """
+        return self._request_json(
+            ANALYSIS_PROMPT,
+            _documents_message(job_description, resume),
+            temperature=0.3,
+            on_partial=on_partial,
+            response_format=ANALYSIS_RESPONSE_FORMAT,
+            prompt_cache_key=_prompt_cache_key(job_description)
+        )
 
-Please provide your analysis in the following JSON format:
-{{
-    "similarity_score": <number between 0-100>,
-    "overall_match": "<Poor/Fair/Good/Excellent>",
-    "key_strengths": ["strength1", "strength2", "strength3"],
-    "analysis_summary": "Brief summary of how well the resume matches the job"
-}}
+    def calculate_similarity_score(self, job_description: str, resume: str,
+                                   on_partial: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Calculate similarity score between job description and resume.
 
-Be objective and thorough in your assessment.
-"""
+        Args:
+            job_description: Job description text
+            resume: Resume text
+            on_partial: Optional callback receiving fields as they stream in
 
+        Returns:
+            Dictionary containing similarity analysis
+        """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert ATS system and recruitment specialist. Provide accurate, objective analysis in valid JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-
-            result = json.loads(response.choices[0].message.content)
-            return result
+            result = self._analyze_documents(job_description, resume, on_partial)
+            return {key: result[key] for key in
+                    ('similarity_score', 'overall_match', 'key_strengths', 'analysis_summary')}
 
         except Exception as e:
             raise Exception(f"Error calculating similarity score: {str(e)}")
 
-    def extract_skills(self, job_description: str, resume: str) -> Dict[str, List[str]]:
+    def extract_skills(self, job_description: str, resume: str,
+                       on_partial: Optional[Callable[[Dict], None]] = None,
+                       local: bool = False) -> Dict[str, List[str]]:
         """
         Extract matching and missing skills.
 
         Args:
             job_description: Job description text
             resume: Resume text
+            on_partial: Optional callback receiving fields as they stream in
+            local: Match against the bundled skills vocabulary only, without an API
+                call. Faster and free, but limited to known skill names and never
+                reports partial matches.
 
         Returns:
             Dictionary with matching_skills and missing_skills lists
         """
-        prompt = f"""
-You are an expert technical recruiter and skills analyst.
-
-Analyze the following job description and resume to identify skills.
-
-JOB DESCRIPTION:
-{job_description}
-
-RESUME:
-{resume}
-
-Identify:
-1. Technical skills, tools, and technologies mentioned in the job description
-2. Which of these skills are present in the resume (matching skills)
-3. Which required/preferred skills are missing from the resume (missing skills)
-
-Provide your analysis in the following JSON format:
-{{
-    "matching_skills": ["skill1", "skill2", "skill3"],
-    "missing_skills": ["skill1", "skill2", "skill3"],
-    "partial_matches": ["skill1: explanation", "skill2: explanation"]
-}}
-
-Be specific and list actual skill names (e.g., "Python", "AWS", "Agile", "Leadership").
-"""
+        if local:
+            resume_skills = set(self.detect_skills(resume))
+            job_skills = self.detect_skills(job_description)
+            return {
+                'matching_skills': [skill for skill in job_skills if skill in resume_skills],
+                'missing_skills': [skill for skill in job_skills if skill not in resume_skills],
+                'partial_matches': []
+            }
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert technical recruiter. Provide accurate skills analysis in valid JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-
-            result = json.loads(response.choices[0].message.content)
-            return result
+            result = self._analyze_documents(job_description, resume, on_partial)
+            return {key: result[key] for key in
+                    ('matching_skills', 'missing_skills', 'partial_matches')}
 
         except Exception as e:
             raise Exception(f"Error extracting skills: {str(e)}")
 
     def generate_recommendations(self, job_description: str, resume: str,
-                                missing_skills: List[str]) -> List[str]:
+                                missing_skills: Optional[List[str]] = None,
+                                on_partial: Optional[Callable[[Dict], None]] = None) -> List[str]:
         """
         Generate actionable recommendations to improve the resume.
 
         Args:
             job_description: Job description text
             resume: Resume text
-            missing_skills: List of skills missing from resume
+            missing_skills: Unused; the model works out the missing skills itself.
+                Kept for backwards compatibility.
+            on_partial: Optional callback receiving fields as they stream in
 
         Returns:
             List of recommendations
         """
-        prompt = f"""
-You are an expert resume writer and career coach.
+        try:
+            result = self._analyze_documents(job_description, resume, on_partial)
+            return result['recommendations']
 
-Based on the job description and current resume, provide specific, actionable recommendations to improve the resume.
+        except Exception as e:
+            raise Exception(f"Error generating recommendations: {str(e)}")
 
-JOB DESCRIPTION:
-{job_description}
+    def detect_skills(self, text: str) -> List[str]:
+        """
+        Find the skills from the bundled skills.txt vocabulary that appear in a text.
 
-RESUME:
-{resume}
+        Runs locally with a single pass over the words of the text, preferring the
+        longest skill name at each position ("React Native" over "React").
 
-MISSING SKILLS:
-{', '.join(missing_skills) if missing_skills else 'None identified'}
+        Args:
+            text: Job description or resume text
 
-Provide 5-8 specific, actionable recommendations in the following JSON format:
-{{
-    "recommendations": [
-        "Specific recommendation 1",
-        "Specific recommendation 2",
-        "Specific recommendation 3"
-    ]
-}}
+        Returns:
+            Skill names in order of first appearance, without duplicates
+        """
+        vocabulary, longest = _skills_vocabulary()
+        tokens = _TOKEN_RE.findall(text.lower())
+        found: Dict[str, None] = {}  # Ordered set of skill names
+        index = 0
+        while index < len(tokens):
+            for length in range(min(longest, len(tokens) - index), 0, -1):
+                skill = vocabulary.get(tuple(tokens[index:index + length]))
+                if skill:
+                    found[skill] = None
+                    index += length
+                    break
+            else:
+                index += 1
+        return list(found)
 
-Focus on:
-- How to highlight relevant experience better
-- Keywords to add (if genuinely applicable)
-- Format/structure improvements
-- Ways to address missing skills
-- Quantifying achievements
-- Tailoring the resume to the job
-"""
+    def batch_match(self, resume_skills: List[str], job_skills: List[List[str]]) -> List[float]:
+        """
+        Score one resume's skills against the skills of many job descriptions.
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert resume writer. Provide specific, actionable recommendations in valid JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.4,
-                response_format={"type": "json_object"}
-            )
+        Uses the Jaccard index (shared skills / all skills) on skill names compared
+        without regard to case or punctuation, so no API calls are made.
+
+        Args:
+            resume_skills: Skills found in the resume
+            job_skills: One list of skills per job description
+
+        Returns:
+            Jaccard similarity (0.0-1.0) for each job description, in input order
+        """
+        resume_set = _normalize_skills(resume_skills)
+        scores = []
+        for skills in job_skills:
+            job_set = _normalize_skills(skills)
+            shared = len(resume_set & job_set)
+            total = len(resume_set) + len(job_set) - shared
+            scores.append(shared / total if total else 0.0)
+        return scores
+
+    def analyze(self, job_description: str, resume: str,
+                on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Perform complete analysis of resume against job description.
+
+        Args:
+            job_description: Job description text or file path
+            resume: Resume text or file path
+            on_progress: Optional callback; when given, responses are streamed and the
+                callback receives all result fields received so far as each one arrives
+
+        Returns:
+            Complete analysis results
+        """
+        job_description = self._prepare_input(job_description, "Job description")
+        resume = self._prepare_input(resume, "Resume")
+
+        if _is_unrelated(job_description, resume):
+            logger.info("Resume is unrelated to the job description, skipping AI analysis")
+            return _unrelated_results()
 
-            result = json.loads(response.choices[0].message.content)
-            return result.get('recommendations', [])
+        cache_key = self._cache_key(job_description, resume)
+        results = self._cache_get(cache_key)
+        if results is not None:
+            logger.info("Using cached analysis")
+            return results
 
+        # Score, skills and recommendations all come from a single request
+        logger.info("Analyzing similarity, skills and recommendations...")
+        try:
+            result = self._analyze_documents(job_description, resume, on_progress)
         except Exception as e:
-            raise Exception(f"Error generating recommendations: {str(e)}")
+            raise Exception(f"Error analyzing resume: {str(e)}")
+
+        results = _compile_results(result)
+        self._cache_set(cache_key, results)
+        return results
 
-    def analyze(self, job_description: str, resume: str) -> Dict:
+    async def analyze_async(self, job_description: str, resume: str) -> Dict:
         """
-        Perform complete analysis of resume against job description.
+        Async version of analyze() for callers that already run an event loop.
 
         Args:
             job_description: Job description text or file path
@@ -407,52 +1054,110 @@ Focus on:
         Returns:
             Complete analysis results
         """
-        # Check if inputs are file paths
-        if os.path.isfile(job_description):
-            job_description = self.extract_text_from_file(job_description)
+        job_description = self._prepare_input(job_description, "Job description")
+        resume = self._prepare_input(resume, "Resume")
+        return await self._analyze_async(self.aclient, job_description, resume)
 
-        if os.path.isfile(resume):
-            resume = self.extract_text_from_file(resume)
+    def analyze_many(self, job_description: str, resumes: List[str],
+                     max_concurrency: int = 8) -> List[Dict]:
+        """
+        Analyze several resumes against one job description concurrently.
 
-        # Validate inputs
-        if not job_description.strip():
-            raise ValueError("Job description cannot be empty")
-        if not resume.strip():
-            raise ValueError("Resume cannot be empty")
+        Requests are sent in parallel (at most max_concurrency at a time), so the
+        batch takes roughly as long as its slowest few requests instead of their sum.
+        Identical resumes are only analyzed once.
 
-        print("Analyzing resume against job description...")
-        print("-" * 50)
+        Args:
+            job_description: Job description text or file path
+            resumes: Resume texts or file paths
+            max_concurrency: Maximum number of requests in flight at once
 
-        # Calculate similarity score
-        print("⏳ Calculating similarity score...")
-        similarity_result = self.calculate_similarity_score(job_description, resume)
+        Returns:
+            Analysis results for each resume, in input order
+        """
+        # Read every file up front so no file parsing blocks the event loop
+        job_description = self._prepare_input(job_description, "Job description")
+        resumes = [self._prepare_input(resume, "Resume") for resume in resumes]
 
-        # Extract skills
-        print("⏳ Extracting skills...")
-        skills_result = self.extract_skills(job_description, resume)
+        logger.info("Analyzing %d resumes against job description...", len(resumes))
+        return asyncio.run(self._analyze_many(job_description, resumes, max_concurrency))
 
-        # Generate recommendations
-        print("⏳ Generating recommendations...")
-        recommendations = self.generate_recommendations(
-            job_description,
-            resume,
-            skills_result.get('missing_skills', [])
-        )
+    async def _analyze_many(self, job_description: str, resumes: List[str],
+                            max_concurrency: int) -> List[Dict]:
+        """Run the requests for analyze_many() on a client owned by this event loop."""
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        # Compile results
-        results = {
-            'similarity_score': similarity_result.get('similarity_score', 0),
-            'overall_match': similarity_result.get('overall_match', 'Unknown'),
-            'key_strengths': similarity_result.get('key_strengths', []),
-            'analysis_summary': similarity_result.get('analysis_summary', ''),
-            'matching_skills': skills_result.get('matching_skills', []),
-            'missing_skills': skills_result.get('missing_skills', []),
-            'partial_matches': skills_result.get('partial_matches', []),
-            'recommendations': recommendations
-        }
+        # Identical resumes in one batch (e.g. the same candidate applying twice)
+        # are analyzed once
+        unique_resumes = list(dict.fromkeys(resumes))
 
+        async with self._async_client() as client:
+            async def analyze_one(resume):
+                async with semaphore:
+                    return await self._analyze_async(client, job_description, resume)
+
+            results = await asyncio.gather(*(analyze_one(resume) for resume in unique_resumes))
+
+        results_by_resume = dict(zip(unique_resumes, results))
+        return [dict(results_by_resume[resume]) for resume in resumes]
+
+    async def _analyze_async(self, client: AsyncOpenAI, job_description: str, resume: str) -> Dict:
+        """Request and compile the analysis of already prepared inputs."""
+        if _is_unrelated(job_description, resume):
+            return _unrelated_results()
+
+        cache_key = self._cache_key(job_description, resume)
+        results = self._cache_get(cache_key)
+        if results is not None:
+            return results
+
+        try:
+            result = await self._request_json_async(
+                client,
+                ANALYSIS_PROMPT,
+                _documents_message(job_description, resume),
+                temperature=0.3,
+                response_format=ANALYSIS_RESPONSE_FORMAT,
+                prompt_cache_key=_prompt_cache_key(job_description)
+            )
+        except Exception as e:
+            raise Exception(f"Error analyzing resume: {str(e)}")
+
+        results = _compile_results(result)
+        self._cache_set(cache_key, results)
         return results
 
+    def _cache_key(self, job_description: str, resume: str) -> str:
+        """Return the results cache key for a pair of documents."""
+        # The model and prompt are part of the key, so changing either never serves stale results
+        key = "\0".join((job_description, resume, self.model, ANALYSIS_PROMPT))
+        return hashlib.blake2b(key.encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Return cached results for key, or None on a miss or when caching is disabled."""
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_set(self, key: str, results: Dict) -> None:
+        """Store results under key if caching is enabled."""
+        if self.cache is not None:
+            self.cache.set(key, results)
+
+    def _prepare_input(self, text: str, name: str) -> str:
+        """Read text from a file if given a file path, and make sure it is not empty."""
+        # Check if input is a file path. Documents span several lines, so only
+        # single-line input needs a stat call to find out.
+        if '\n' not in text:
+            file_stat = _regular_file_stat(text)
+            if file_stat is not None:
+                text = self._read_file(Path(text), file_stat)
+
+        # Validate input
+        if not text.strip():
+            raise ValueError(f"{name} cannot be empty")
+        return text
+
     def print_results(self, results: Dict) -> None:
         """
         Print analysis results in a formatted way.
@@ -460,50 +1165,121 @@ Focus on:
         Args:
             results: Analysis results dictionary
         """
-        print("\n" + "=" * 70)
-        print("RESUME ANALYSIS RESULTS")
-        print("=" * 70)
+        # Build the whole report first and write it once, instead of one print per line
+        lines = self._header_lines()
+        for key in RESULT_SECTIONS:
+            lines += self._section_lines(key, results)
+        lines += self._footer_lines()
+        print("\n".join(lines))
+
+    def print_header(self) -> None:
+        """Print the heading shown above the results."""
+        print("\n".join(self._header_lines()))
+
+    def print_footer(self) -> None:
+        """Print the rule shown below the results."""
+        print("\n".join(self._footer_lines()))
+
+    def print_section(self, key: str, results: Dict) -> None:
+        """
+        Print one field of the results; empty sections are skipped.
+
+        Args:
+            key: Results field to print (one of RESULT_SECTIONS)
+            results: Analysis results dictionary, possibly still partial
+        """
+        lines = self._section_lines(key, results)
+        if lines:
+            print("\n".join(lines))
+
+    def _header_lines(self) -> List[str]:
+        """Return the lines of the heading shown above the results."""
+        return ["\n" + "=" * 70, "RESUME ANALYSIS RESULTS", "=" * 70]
+
+    def _footer_lines(self) -> List[str]:
+        """Return the lines of the rule shown below the results."""
+        return ["\n" + "=" * 70]
+
+    def _section_lines(self, key: str, results: Dict) -> List[str]:
+        """Return the lines printed for one field of the results."""
+        lines = []
 
         # Similarity Score
-        print(f"\n📊 SIMILARITY SCORE: {results['similarity_score']}/100")
-        print(f"   Overall Match: {results['overall_match']}")
+        if key == 'similarity_score':
+            lines.append(f"\n📊 SIMILARITY SCORE: {results['similarity_score']}/100")
+        elif key == 'overall_match':
+            lines.append(f"   Overall Match: {results['overall_match']}")
 
         # Analysis Summary
-        if results.get('analysis_summary'):
-            print(f"\n📝 SUMMARY:")
-            print(f"   {results['analysis_summary']}")
+        elif key == 'analysis_summary':
+            if results.get('analysis_summary'):
+                lines.append(f"\n📝 SUMMARY:")
+                lines.append(f"   {results['analysis_summary']}")
 
         # Key Strengths
-        if results.get('key_strengths'):
-            print(f"\n✅ KEY STRENGTHS:")
-            for i, strength in enumerate(results['key_strengths'], 1):
-                print(f"   {i}. {strength}")
+        elif key == 'key_strengths':
+            if results.get('key_strengths'):
+                lines.append(f"\n✅ KEY STRENGTHS:")
+                for i, strength in enumerate(results['key_strengths'], 1):
+                    lines.append(f"   {i}. {strength}")
 
         # Matching Skills
-        if results.get('matching_skills'):
-            print(f"\n✨ MATCHING SKILLS ({len(results['matching_skills'])}):")
-            for skill in results['matching_skills']:
-                print(f"   • {skill}")
+        elif key == 'matching_skills':
+            if results.get('matching_skills'):
+                lines.append(f"\n✨ MATCHING SKILLS ({len(results['matching_skills'])}):")
+                for skill in results['matching_skills']:
+                    lines.append(f"   • {skill}")
 
         # Partial Matches
-        if results.get('partial_matches'):
-            print(f"\n⚠️  PARTIAL MATCHES ({len(results['partial_matches'])}):")
-            for match in results['partial_matches']:
-                print(f"   • {match}")
+        elif key == 'partial_matches':
+            if results.get('partial_matches'):
+                lines.append(f"\n⚠️  PARTIAL MATCHES ({len(results['partial_matches'])}):")
+                for match in results['partial_matches']:
+                    lines.append(f"   • {match}")
 
         # Missing Skills
-        if results.get('missing_skills'):
-            print(f"\n❌ MISSING SKILLS ({len(results['missing_skills'])}):")
-            for skill in results['missing_skills']:
-                print(f"   • {skill}")
+        elif key == 'missing_skills':
+            if results.get('missing_skills'):
+                lines.append(f"\n❌ MISSING SKILLS ({len(results['missing_skills'])}):")
+                for skill in results['missing_skills']:
+                    lines.append(f"   • {skill}")
 
         # Recommendations
-        if results.get('recommendations'):
-            print(f"\n💡 RECOMMENDATIONS ({len(results['recommendations'])}):")
-            for i, rec in enumerate(results['recommendations'], 1):
-                print(f"   {i}. {rec}")
+        elif key == 'recommendations':
+            if results.get('recommendations'):
+                lines.append(f"\n💡 RECOMMENDATIONS ({len(results['recommendations'])}):")
+                for i, rec in enumerate(results['recommendations'], 1):
+                    lines.append(f"   {i}. {rec}")
+
+        return lines
+
+    def print_streaming(self, job_description: str, resume: str) -> Dict:
+        """
+        Analyze and print each section of the results as soon as it arrives.
+
+        Args:
+            job_description: Job description text or file path
+            resume: Resume text or file path
 
-        print("\n" + "=" * 70)
+        Returns:
+            Complete analysis results
+        """
+        printed: List[str] = []
+
+        def print_new_sections(results):
+            if not printed:
+                self.print_header()
+            for key in RESULT_SECTIONS:
+                if key in results and key not in printed:
+                    self.print_section(key, results)
+                    printed.append(key)
+
+        results = self.analyze(job_description, resume, on_progress=print_new_sections)
+
+        # Cached results arrive all at once, without any progress updates
+        print_new_sections(results)
+        self.print_footer()
+        return results
 
     def save_results(self, results: Dict, output_file: str = "resume_analysis.json") -> None:
         """
@@ -514,15 +1290,23 @@ Focus on:
             output_file: Output file path
         """
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            print(f"\n💾 Results saved to: {output_file}")
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False)
+            logger.info("Results saved to: %s", output_file)
         except Exception as e:
-            print(f"\n⚠️  Error saving results: {str(e)}")
+            logger.error("Error saving results: %s", e)
 
 
 def main():
     """Main function to demonstrate usage."""
+    # Show the analyzer's progress messages only: other libraries keep the
+    # WARNING default (httpx logs every request at INFO)
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
 
     # Example usage
     print("Resume Analyzer with OpenAI")
@@ -593,9 +1377,9 @@ Bachelor's in Computer Science
 
     # Perform analysis
     try:
-        results = analyzer.analyze(job_description, resume)
-        analyzer.print_results(results)
-        analyzer.save_results(results)
+        with analyzer:
+            results = analyzer.print_streaming(job_description, resume)
+            analyzer.save_results(results)
 
     except Exception as e:
         print(f"\n❌ Error during analysis: {str(e)}")
@@ -0,0 +1,44 @@
+"""
+Tests for the upload text cache of the home page
+"""
+
+import pytest
+
+import app  # noqa: F401 - pages can only be imported once the Dash app exists
+from pages import home
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    """Return a cached parser that records the uploads it actually parses."""
+    monkeypatch.setattr(home, '_text_cache', type(home._text_cache)())
+    monkeypatch.setattr(home, 'TEXT_CACHE_SIZE', 2)
+    calls = []
+
+    @home._cache_by_content
+    def parse(data):
+        calls.append(data)
+        return data.decode('utf-8').upper()
+
+    parse.calls = calls
+    return parse
+
+
+class TestCacheByContent:
+    """Reusing the text extracted from identical uploads."""
+
+    def test_identical_upload_is_parsed_once(self, parser):
+        assert parser(b'python') == 'PYTHON'
+        assert parser(b'python') == 'PYTHON'
+        assert parser.calls == [b'python']
+
+    def test_least_recently_used_upload_is_evicted(self, parser):
+        parser(b'one')
+        parser(b'two')
+        parser(b'one')  # Now more recent than b'two'
+        parser(b'three')
+        assert parser.calls == [b'one', b'two', b'three']
+
+        parser(b'one')
+        parser(b'two')
+        assert parser.calls == [b'one', b'two', b'three', b'two']
@@ -0,0 +1,583 @@
+"""
+Tests for the local (API-free) helpers of the resume analyzer
+"""
+
+import io
+import json
+import os
+import threading
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+
+from resume_analyzer import ResumeAnalyzer, resume_analyzer
+from resume_analyzer.resume_analyzer import (
+    _compact,
+    _is_unrelated,
+    _parse_partial_json,
+    _stream_docx_text,
+    _token_overlap,
+)
+
+PYTHON_RESUME = """
+Jane Smith - Senior Backend Engineer
+
+Summary
+Backend engineer with eight years of experience designing, building and operating
+web services in Python. Comfortable owning features end to end, from data modelling
+and API design through deployment, monitoring and on-call support.
+
+Experience
+Senior Software Engineer, Northwind Analytics (2019 - present)
+- Built and maintained Django and Django REST Framework services handling millions
+  of requests per day for reporting and billing customers
+- Designed PostgreSQL schemas, wrote migrations and tuned slow queries with indexes
+  and query plans, cutting report generation time by sixty percent
+- Moved the platform to AWS using EC2, S3, RDS and Lambda, with infrastructure
+  managed in Terraform and deployments automated through GitHub Actions
+- Mentored four junior engineers and ran the team's weekly code review sessions
+
+Software Engineer, Contoso Retail (2016 - 2019)
+- Developed inventory and order management features in Python and Django
+- Wrote background jobs with Celery and Redis for nightly stock reconciliation
+- Added automated tests with pytest, raising coverage from thirty to eighty percent
+- Worked closely with product managers and designers in two-week Scrum sprints
+
+Skills
+Python, Django, Django REST Framework, PostgreSQL, Redis, Celery, AWS, Docker,
+Terraform, GitHub Actions, pytest, Linux, Git, REST API design, Agile, Scrum
+
+Education
+BSc Computer Science, University of Leeds
+"""
+
+PYTHON_JOB = """
+We are hiring a senior backend engineer to build Python and Django web services, design
+PostgreSQL schemas, deploy to AWS, write tests with pytest and mentor junior engineers
+in an Agile Scrum team.
+"""
+
+ANALYSIS_REPLY = {
+    'similarity_score': 82,
+    'overall_match': 'Good',
+    'analysis_summary': "Strong backend match.",
+    'key_strengths': ["Django"],
+    'matching_skills': ["Python", "Django"],
+    'partial_matches': [],
+    'missing_skills': ["Kubernetes"],
+    'recommendations': ["Quantify the reporting work."]
+}
+
+RUSSIAN_JOB = """
+Ищем опытного разработчика на Python для работы над нашим веб-сервисом. Вы будете
+проектировать и развивать серверную часть, писать тесты, работать с базами данных
+PostgreSQL и облачной инфраструктурой AWS, участвовать в код-ревью и помогать
+младшим коллегам. Требования: опыт коммерческой разработки на Python от трёх лет,
+знание Django, понимание принципов проектирования REST API, умение работать в команде.
+"""
+
+RUSSIAN_RESUME = """
+Иван Петров, разработчик на Python. Пять лет опыта коммерческой разработки серверной
+части веб-сервисов. Проектировал REST API на Django, работал с базами данных
+PostgreSQL, настраивал инфраструктуру AWS, писал автоматические тесты, проводил
+код-ревью и помогал младшим коллегам. Умею работать в команде и отвечать за результат.
+"""
+
+CHINESE_JOB = """
+我们正在招聘一名高级后端开发工程师，负责设计和开发公司核心业务系统。要求熟练掌握Python和Django框架，
+熟悉PostgreSQL数据库设计与优化，有AWS云平台使用经验，具备良好的沟通能力和团队合作精神。
+"""
+
+CHINESE_RESUME = """
+张伟，后端开发工程师，五年工作经验。熟练使用Python和Django框架开发业务系统，负责PostgreSQL数据库设计与
+性能优化，在AWS云平台上部署和维护服务。具备良好的沟通能力，注重团队合作，曾带领三人小组完成核心项目开发。
+"""
+
+
+def stub_completions(monkeypatch, analyzer, reply=ANALYSIS_REPLY):
+    """Answer the analyzer's chat completion requests with reply; return the requests sent."""
+    requests = []
+
+    def create(**request):
+        requests.append(request)
+        message = SimpleNamespace(content=json.dumps(reply))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(analyzer.client.chat.completions, 'create', create)
+    return requests
+
+
+class TestTokenOverlap:
+    """The pre-filter that skips the API for clearly unrelated documents."""
+
+    def test_short_job_description_matches_long_resume(self):
+        job = "Looking for a Python Django engineer with AWS and PostgreSQL experience."
+        assert not _is_unrelated(job, PYTHON_RESUME)
+
+    def test_title_only_job_description_is_not_filtered(self):
+        assert _token_overlap("Senior Python Engineer", PYTHON_RESUME) is None
+        assert not _is_unrelated("Senior Python Engineer", PYTHON_RESUME)
+
+    def test_brief_job_description_is_measured_against_itself(self):
+        job = (
+            "We are hiring a senior backend engineer to build Python and Django web services, "
+            "design PostgreSQL schemas, deploy to AWS, write tests with pytest and mentor "
+            "junior engineers in an Agile Scrum team."
+        )
+        assert _token_overlap(job, PYTHON_RESUME) > 0.5
+        assert not _is_unrelated(job, PYTHON_RESUME)
+
+    def test_matching_russian_documents_are_related(self):
+        assert _token_overlap(RUSSIAN_JOB, RUSSIAN_RESUME) > 0.2
+        assert not _is_unrelated(RUSSIAN_JOB, RUSSIAN_RESUME)
+
+    def test_matching_chinese_documents_are_related(self):
+        assert _token_overlap(CHINESE_JOB, CHINESE_RESUME) > 0.2
+        assert not _is_unrelated(CHINESE_JOB, CHINESE_RESUME)
+
+    def test_documents_without_shared_words_are_unrelated(self):
+        chinese_job = "".join(char for char in CHINESE_JOB if not char.isascii())
+        assert _token_overlap(chinese_job, PYTHON_RESUME) == 0
+        assert _is_unrelated(chinese_job, PYTHON_RESUME)
+
+
+def make_docx(body):
+    """Return an in-memory DOCX whose document body is the given WordprocessingML."""
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document'
+        ' xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        ' xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+        ' xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"'
+        ' xmlns:v="urn:schemas-microsoft-com:vml">'
+        f'<w:body>{body}</w:body></w:document>'
+    )
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, 'w') as archive:
+        archive.writestr('word/document.xml', document)
+    data.seek(0)
+    return data
+
+
+class TestStreamDocxText:
+    """The streaming DOCX reader."""
+
+    def test_paragraphs_tabs_breaks_and_tables(self):
+        docx = make_docx(
+            '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+            '<w:r><w:t>John</w:t></w:r><w:r><w:tab/><w:t xml:space="preserve"> Doe</w:t></w:r></w:p>'
+            '<w:p/>'
+            '<w:tbl><w:tr>'
+            '<w:tc><w:p><w:r><w:t>Python</w:t><w:br/><w:t>AWS</w:t></w:r></w:p></w:tc>'
+            '<w:tc><w:p/></w:tc>'
+            '</w:tr></w:tbl>'
+            '<w:p><w:r><w:t>End</w:t></w:r></w:p>'
+        )
+        assert _stream_docx_text(docx) == "John\t Doe\nPython\nAWS\nEnd"
+
+    def test_text_box_is_read_once_without_its_anchor_text(self):
+        text_box = '<w:p><w:r><w:t>SIDEBAR SKILLS: Python</w:t></w:r></w:p>'
+        docx = make_docx(
+            '<w:p><w:r><w:t xml:space="preserve">Anchor </w:t></w:r>'
+            '<w:r><mc:AlternateContent>'
+            '<mc:Choice Requires="wps"><w:drawing><wps:txbx><w:txbxContent>'
+            f'{text_box}'
+            '</w:txbxContent></wps:txbx></w:drawing></mc:Choice>'
+            '<mc:Fallback><w:pict><v:textbox><w:txbxContent>'
+            f'{text_box}'
+            '</w:txbxContent></v:textbox></w:pict></mc:Fallback>'
+            '</mc:AlternateContent></w:r>'
+            '<w:r><w:t>text</w:t></w:r></w:p>'
+        )
+        assert _stream_docx_text(docx) == "SIDEBAR SKILLS: Python\nAnchor text"
+
+
+class TestCompact:
+    """Trimming documents before they are sent to the model."""
+
+    def test_urls_spaces_and_blank_lines_are_removed(self):
+        text = "Jane  Smith\t\tEngineer\n\n   \nhttps://example.com/jane Portfolio\nSee www.example.org"
+        assert _compact(text) == "Jane Smith Engineer\nPortfolio\nSee"
+
+    def test_lines_repeated_three_times_are_kept_once(self):
+        text = "\n".join(["Page header", "Python", "Page header", "Django", "Page header"])
+        assert _compact(text) == "Page header\nPython\nDjango"
+
+    def test_lines_repeated_twice_are_kept(self):
+        text = "\n".join(["- Python", "Team lead", "- Python"])
+        assert _compact(text) == "- Python\nTeam lead\n- Python"
+
+class TestParsePartialJson:
+    """Reading the complete fields of a streamed JSON reply."""
+
+    def test_only_complete_fields_are_returned(self):
+        buffer = '{"match_score": 85, "matching_skills": ["Python", "Dja'
+        assert _parse_partial_json(buffer) == {'match_score': 85}
+
+    def test_complete_object(self):
+        buffer = '{"match_score": 85, "matching_skills": ["Python"]}'
+        assert _parse_partial_json(buffer) == {'match_score': 85, 'matching_skills': ['Python']}
+
+    def test_number_at_end_of_buffer_is_left_out(self):
+        assert _parse_partial_json('{"summary": "Good fit", "match_score": 8') == {'summary': 'Good fit'}
+
+    def test_escaped_quotes(self):
+        buffer = '{"summary": "Says \\"hi\\" and {braces}", "missing_skills": ["C\\"'
+        assert _parse_partial_json(buffer) == {'summary': 'Says "hi" and {braces}'}
+
+    def test_incomplete_key_and_missing_brace(self):
+        assert _parse_partial_json('') == {}
+        assert _parse_partial_json('"match_score": 85,') == {}
+        assert _parse_partial_json('{"match_score": 85, "summ') == {'match_score': 85}
+        assert _parse_partial_json('{"match_score": 85, "summary"') == {'match_score': 85}
+
+def make_pdf(*pages):
+    """Return the bytes of a PDF with one line of Helvetica text per page."""
+    count = len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(count))
+        + b"] /Count %d >>" % count,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for index, text in enumerate(pages):
+        content = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode('latin-1')
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * index)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+class TestReadFile:
+    """Reusing text extracted from a file until the file changes."""
+
+    @pytest.fixture
+    def analyzer(self):
+        analyzer = ResumeAnalyzer(api_key='test-key', cache_dir=None)
+        yield analyzer
+        analyzer.close()
+
+    @pytest.fixture
+    def extracted(self, monkeypatch, analyzer):
+        """Return the list of paths the analyzer actually extracts text from."""
+        paths = []
+        extract_text = analyzer._extract_text
+
+        def recording_extract_text(path):
+            paths.append(path)
+            return extract_text(path)
+
+        monkeypatch.setattr(analyzer, '_extract_text', recording_extract_text)
+        return paths
+
+    def test_unchanged_file_is_read_once(self, analyzer, extracted, tmp_path):
+        path = tmp_path / "resume.txt"
+        path.write_text("Python developer", encoding='utf-8')
+        assert analyzer.extract_text_from_file(str(path)) == "Python developer"
+        assert analyzer.extract_text_from_file(str(path)) == "Python developer"
+        assert len(extracted) == 1
+
+    def test_file_is_read_again_when_its_size_changes(self, analyzer, extracted, tmp_path):
+        path = tmp_path / "resume.txt"
+        path.write_text("Python developer", encoding='utf-8')
+        stat_result = path.stat()
+        analyzer.extract_text_from_file(str(path))
+
+        path.write_text("Senior Python developer", encoding='utf-8')
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+        assert analyzer.extract_text_from_file(str(path)) == "Senior Python developer"
+        assert len(extracted) == 2
+
+    def test_file_is_read_again_when_its_mtime_changes(self, analyzer, extracted, tmp_path):
+        path = tmp_path / "resume.txt"
+        path.write_text("Python developer", encoding='utf-8')
+        stat_result = path.stat()
+        analyzer.extract_text_from_file(str(path))
+
+        path.write_text("Django developer", encoding='utf-8')  # Same size
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        assert analyzer.extract_text_from_file(str(path)) == "Django developer"
+        assert len(extracted) == 2
+
+    def test_missing_file(self, analyzer, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            analyzer.extract_text_from_file(str(tmp_path / "missing.txt"))
+
+
+class TestExtractFromPdf:
+    """PDF text extraction and its backends."""
+
+    def setup_method(self):
+        self.analyzer = ResumeAnalyzer(api_key='test-key', cache_dir=None)
+
+    def teardown_method(self):
+        self.analyzer.close()
+
+    def stub_backends(self, monkeypatch, **results):
+        """Replace the PDF backends with stubs; return the list of backends called."""
+        calls = []
+        for backend in resume_analyzer.PDF_BACKENDS:
+            def extract(source, backend=backend):
+                calls.append(backend)
+                result = results.get(backend, "")
+                if isinstance(result, Exception):
+                    raise result
+                return result
+            monkeypatch.setattr(self.analyzer, f"_extract_pdf_with_{backend}", extract)
+        return calls
+
+    def test_auto_tries_backends_in_order_until_one_returns_text(self, monkeypatch):
+        calls = self.stub_backends(
+            monkeypatch, pdfium="  \n", pymupdf=ImportError(), pdfplumber="Resume text"
+        )
+        assert self.analyzer._extract_from_pdf(io.BytesIO(b"%PDF"), force_backend='auto') == "Resume text"
+        assert calls == ['pdfium', 'pymupdf', 'pdfplumber']
+
+    def test_auto_reports_the_last_backend_error(self, monkeypatch):
+        calls = self.stub_backends(monkeypatch, pdfplumber=ValueError("broken xref"))
+        with pytest.raises(Exception, match="broken xref"):
+            self.analyzer._extract_from_pdf(io.BytesIO(b"%PDF"), force_backend='auto')
+        assert calls == list(resume_analyzer.PDF_BACKENDS)
+
+    def test_force_backend_uses_only_that_backend(self, monkeypatch):
+        calls = self.stub_backends(monkeypatch, pdfium="PDFium text", pypdf2="PyPDF2 text")
+        assert self.analyzer._extract_from_pdf(io.BytesIO(b"%PDF"), force_backend='PyPDF2') == "PyPDF2 text"
+        assert calls == ['pypdf2']
+
+    def test_forced_backend_must_be_installed(self, monkeypatch):
+        self.stub_backends(monkeypatch, pymupdf=ImportError())
+        with pytest.raises(Exception, match="'pymupdf' is not installed"):
+            self.analyzer._extract_from_pdf(io.BytesIO(b"%PDF"), force_backend='pymupdf')
+
+    def test_pdf_backend_setting_selects_one_backend(self, monkeypatch):
+        monkeypatch.setattr(resume_analyzer, 'PDF_BACKEND', 'pdfplumber')
+        calls = self.stub_backends(monkeypatch, pdfium="PDFium text", pdfplumber="")
+        with pytest.raises(Exception, match="No text could be extracted"):
+            self.analyzer._extract_from_pdf(io.BytesIO(b"%PDF"))
+        assert calls == ['pdfplumber']
+
+    def test_force_backend_overrides_pdf_backend_setting(self, monkeypatch):
+        monkeypatch.setattr(resume_analyzer, 'PDF_BACKEND', 'pdfplumber')
+        calls = self.stub_backends(monkeypatch, pdfium="PDFium text")
+        assert self.analyzer._extract_from_pdf(io.BytesIO(b"%PDF"), force_backend='auto') == "PDFium text"
+        assert calls == ['pdfium']
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown PDF backend 'poppler'"):
+            self.analyzer._extract_from_pdf(io.BytesIO(b"%PDF"), force_backend='poppler')
+
+    def test_pdfium_from_several_threads(self):
+        # PDFium is not thread-safe: unguarded, this crashes the interpreter
+        data = make_pdf(*(f"Page {number} Python Django" for number in range(20)))
+        texts = []
+
+        def extract():
+            for _ in range(10):
+                texts.append(self.analyzer._extract_from_pdf(io.BytesIO(data), force_backend='pdfium'))
+
+        threads = [threading.Thread(target=extract) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(texts) == 80
+        assert all(text.startswith("Page 0 Python Django") and "Page 19" in text for text in texts)
+
+    def test_pdfplumber_pages_are_extracted_by_one_shared_pool(self, monkeypatch):
+        monkeypatch.setattr(resume_analyzer, 'PDF_PARALLEL_WORKERS', 2)
+        monkeypatch.setattr(resume_analyzer, '_pdfplumber_pool_owner', None)
+        data = make_pdf(*(f"Page {number}" for number in range(5)))
+
+        expected = "".join(f"Page {number}\n" for number in range(5))
+        assert self.analyzer._extract_from_pdf(io.BytesIO(data), force_backend='pdfplumber') == expected
+        pool = resume_analyzer._pdfplumber_pool()
+        assert self.analyzer._extract_from_pdf(io.BytesIO(data), force_backend='pdfplumber') == expected
+        assert resume_analyzer._pdfplumber_pool() is pool
+        pool.shutdown()
+
+
+class TestClose:
+    """Releasing the analyzer's HTTP connections."""
+
+    def test_close_closes_sync_and_async_clients(self):
+        analyzer = ResumeAnalyzer(api_key='test-key', cache_dir=None)
+        async_client = analyzer.aclient
+        analyzer.close()
+        assert analyzer.client.is_closed()
+        assert async_client.is_closed()
+
+    def test_context_manager_without_async_use(self):
+        with ResumeAnalyzer(api_key='test-key', cache_dir=None) as analyzer:
+            pass
+        assert analyzer.client.is_closed()
+        assert analyzer._aclient is None
+
+
+class TestDetectSkills:
+    """Local skill detection with the bundled vocabulary."""
+
+    def setup_method(self):
+        self.analyzer = ResumeAnalyzer(api_key='test-key', cache_dir=None)
+
+    def teardown_method(self):
+        self.analyzer.close()
+
+    def test_plain_english_prose_has_no_skills(self):
+        prose = (
+            "You will excel in a fast-paced team; the rest of the role is about bringing "
+            "unity to a busy group, a swift and agile approach to change, and the spark "
+            "to mentor others. Ruby and Julia sit next to the apache helicopter model "
+            "by the dart board, where the oracle of office networking holds court."
+        )
+        assert self.analyzer.detect_skills(prose) == []
+
+    def test_skills_are_found_with_their_longest_name(self):
+        text = "Built REST APIs in Node.js and React Native on AWS Lambda; reports in MS Excel."
+        assert self.analyzer.detect_skills(text) == [
+            'REST APIs', 'Node.js', 'React Native', 'AWS Lambda', 'MS Excel'
+        ]
+
+    def test_local_extract_skills(self):
+        skills = self.analyzer.extract_skills(
+            "Python, Django and Kubernetes required", "Python and Django developer", local=True
+        )
+        assert skills == {
+            'matching_skills': ['Python', 'Django'],
+            'missing_skills': ['Kubernetes'],
+            'partial_matches': []
+        }
+
+
+class TestResultsCache:
+    """Reusing the results of earlier analyses of the same documents."""
+
+    @pytest.fixture
+    def analyzer(self, tmp_path):
+        analyzer = ResumeAnalyzer(api_key='test-key', cache_dir=str(tmp_path))
+        yield analyzer
+        analyzer.close()
+
+    def test_repeated_analysis_is_served_from_cache(self, monkeypatch, analyzer):
+        requests = stub_completions(monkeypatch, analyzer)
+        first = analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+        second = analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+        assert first == second
+        assert first['similarity_score'] == 82
+        assert len(requests) == 1
+
+    def test_cache_is_keyed_by_content_not_by_path(self, monkeypatch, analyzer, tmp_path):
+        requests = stub_completions(monkeypatch, analyzer)
+        resume_file = tmp_path / "resume.txt"
+        resume_file.write_text(PYTHON_RESUME, encoding='utf-8')
+        analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+        analyzer.analyze(PYTHON_JOB, str(resume_file))
+        assert len(requests) == 1
+
+    def test_cache_persists_across_analyzers(self, monkeypatch, analyzer, tmp_path):
+        stub_completions(monkeypatch, analyzer)
+        results = analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+        analyzer.close()
+
+        with ResumeAnalyzer(api_key='test-key', cache_dir=str(tmp_path)) as reopened:
+            requests = stub_completions(monkeypatch, reopened)
+            assert reopened.analyze(PYTHON_JOB, PYTHON_RESUME) == results
+        assert requests == []
+
+    def test_key_covers_both_documents_and_the_model(self, analyzer):
+        key = analyzer._cache_key(PYTHON_JOB, PYTHON_RESUME)
+        assert analyzer._cache_key(PYTHON_JOB, PYTHON_RESUME) == key
+        assert analyzer._cache_key(PYTHON_JOB, PYTHON_RESUME + " ") != key
+        assert analyzer._cache_key(PYTHON_JOB + " ", PYTHON_RESUME) != key
+        analyzer.model = "gpt-4o"
+        assert analyzer._cache_key(PYTHON_JOB, PYTHON_RESUME) != key
+
+    def test_changed_model_is_not_served_stale_results(self, monkeypatch, analyzer):
+        requests = stub_completions(monkeypatch, analyzer)
+        analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+        analyzer.model = "gpt-4o"
+        analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+        assert [request['model'] for request in requests] == ["gpt-4o-mini", "gpt-4o"]
+
+    def test_without_cache_dir_every_analysis_is_requested(self, monkeypatch):
+        with ResumeAnalyzer(api_key='test-key', cache_dir=None) as analyzer:
+            requests = stub_completions(monkeypatch, analyzer)
+            analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+            analyzer.analyze(PYTHON_JOB, PYTHON_RESUME)
+        assert len(requests) == 2
+
+
+class TestAnalyzeMany:
+    """Concurrent analysis of several resumes against one job description."""
+
+    OTHER_RESUME = (
+        "John Doe, Python developer. Built Django web services and REST APIs, designed "
+        "PostgreSQL schemas, deployed to AWS, wrote tests with pytest and worked as a "
+        "backend engineer in an Agile Scrum team."
+    )
+
+    def test_identical_resumes_are_analyzed_once(self, monkeypatch):
+        requests = []
+
+        async def create(**request):
+            requests.append(request)
+            score = 90 if "Jane Smith" in request['messages'][1]['content'] else 40
+            message = SimpleNamespace(content=json.dumps({**ANALYSIS_REPLY, 'similarity_score': score}))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        with ResumeAnalyzer(api_key='test-key', cache_dir=None) as analyzer:
+            async_client = analyzer._async_client
+
+            def stubbed_async_client():
+                client = async_client()
+                monkeypatch.setattr(client.chat.completions, 'create', create)
+                return client
+
+            monkeypatch.setattr(analyzer, '_async_client', stubbed_async_client)
+            results = analyzer.analyze_many(
+                PYTHON_JOB, [PYTHON_RESUME, self.OTHER_RESUME, PYTHON_RESUME]
+            )
+
+        assert len(requests) == 2
+        assert [result['similarity_score'] for result in results] == [90, 40, 90]
+        # Duplicates get their own copy of the results
+        assert results[0] == results[2] and results[0] is not results[2]
+
+
+class TestBatchMatch:
+    """API-free scoring of one resume's skills against many jobs."""
+
+    def setup_method(self):
+        self.analyzer = ResumeAnalyzer(api_key='test-key', cache_dir=None)
+
+    def teardown_method(self):
+        self.analyzer.close()
+
+    def test_scores_each_job_by_jaccard_index(self):
+        scores = self.analyzer.batch_match(
+            ['Python', 'Django', 'AWS', 'Docker'],
+            [['python', 'django'], ['Python', 'Kubernetes', 'Go'], ['Java'], []]
+        )
+        assert scores == [0.5, 1 / 6, 0.0, 0.0]
+
+    def test_ignores_case_punctuation_and_duplicates(self):
+        scores = self.analyzer.batch_match(
+            ['Node.js', 'C++', 'C#'], [['NodeJS'], ['node js', 'c++', 'C#', 'C#']]
+        )
+        assert scores == [0.0, 1.0]
+
+    def test_jobs_or_resume_without_skills(self):
+        assert self.analyzer.batch_match([], [['Python'], []]) == [0.0, 0.0]
+        assert self.analyzer.batch_match(['Python'], []) == []